@@ -0,0 +1,181 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ENUM_TYPES = (
+    "node_logs_status",
+    "run_history_trigger_type",
+    "run_history_status",
+    "secrets_secret_type",
+    "users_role",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "templates",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("category", sa.String(length=100), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("plan_json", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("canvas_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("usage_count", sa.Integer(), nullable=True),
+        sa.Column("is_public", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "users",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("password_hash", sa.String(length=255), nullable=True),
+        sa.Column("name", sa.String(length=255), nullable=True),
+        sa.Column(
+            "role", sa.Enum("admin", "owner", "editor", "viewer", name="users_role"), nullable=True
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_table(
+        "plans",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("owner_id", sa.UUID(), nullable=True),
+        sa.Column("current_version_id", sa.UUID(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.ForeignKeyConstraint(
+            ["owner_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "secrets",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("encrypted_value", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "secret_type",
+            sa.Enum(
+                "api_key", "oauth", "password", "connection_string", name="secrets_secret_type"
+            ),
+            nullable=True,
+        ),
+        sa.Column("owner_id", sa.UUID(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.ForeignKeyConstraint(
+            ["owner_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "plan_versions",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("plan_id", sa.UUID(), nullable=True),
+        sa.Column("version_number", sa.Integer(), nullable=False),
+        sa.Column("plan_json", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("canvas_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("created_by", sa.UUID(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.ForeignKeyConstraint(
+            ["created_by"],
+            ["users.id"],
+        ),
+        sa.ForeignKeyConstraint(["plan_id"], ["plans.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "run_history",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("plan_id", sa.UUID(), nullable=True),
+        sa.Column("version_id", sa.UUID(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "pending", "running", "completed", "failed", "cancelled", name="run_history_status"
+            ),
+            nullable=True,
+        ),
+        sa.Column(
+            "trigger_type",
+            sa.Enum("manual", "webhook", "schedule", name="run_history_trigger_type"),
+            nullable=True,
+        ),
+        sa.Column(
+            "started_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["plan_id"],
+            ["plans.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["version_id"],
+            ["plan_versions.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "node_logs",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("run_id", sa.UUID(), nullable=True),
+        sa.Column("node_id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "pending", "running", "completed", "failed", "skipped", name="node_logs_status"
+            ),
+            nullable=True,
+        ),
+        sa.Column("input_data", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("output_data", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("error_data", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["run_id"], ["run_history.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("node_logs")
+    op.drop_table("run_history")
+    op.drop_table("plan_versions")
+    op.drop_table("secrets")
+    op.drop_table("plans")
+    op.drop_table("users")
+    op.drop_table("templates")
+    for enum_type in ENUM_TYPES:
+        op.execute(f"DROP TYPE IF EXISTS {enum_type}")
@@ -0,0 +1,51 @@
+"""Add lookup and BRIN indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_plans_is_active", "plans", ["is_active"], unique=False)
+    op.create_index("ix_plans_owner_id", "plans", ["owner_id"], unique=False)
+    op.create_index("ix_run_history_plan_id", "run_history", ["plan_id"], unique=False)
+    op.create_index(
+        "ix_run_history_started_at",
+        "run_history",
+        ["started_at"],
+        unique=False,
+        postgresql_using="brin",
+    )
+    op.create_index("ix_run_history_status", "run_history", ["status"], unique=False)
+    op.create_index("ix_node_logs_node_id", "node_logs", ["node_id"], unique=False)
+    op.create_index("ix_node_logs_run_id", "node_logs", ["run_id"], unique=False)
+    op.create_index(
+        "ix_node_logs_started_at",
+        "node_logs",
+        ["started_at"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_node_logs_started_at", table_name="node_logs", postgresql_using="brin")
+    op.drop_index("ix_node_logs_run_id", table_name="node_logs")
+    op.drop_index("ix_node_logs_node_id", table_name="node_logs")
+    op.drop_index("ix_run_history_status", table_name="run_history")
+    op.drop_index("ix_run_history_started_at", table_name="run_history", postgresql_using="brin")
+    op.drop_index("ix_run_history_plan_id", table_name="run_history")
+    op.drop_index("ix_plans_owner_id", table_name="plans")
+    op.drop_index("ix_plans_is_active", table_name="plans")
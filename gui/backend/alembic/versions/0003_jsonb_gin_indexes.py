@@ -0,0 +1,65 @@
+"""Add GIN indexes on plan and canvas JSONB columns
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_plan_versions_plan_json",
+        "plan_versions",
+        ["plan_json"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"plan_json": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_templates_plan_json",
+        "templates",
+        ["plan_json"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"plan_json": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_templates_canvas_json",
+        "templates",
+        ["canvas_json"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"canvas_json": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_templates_canvas_json",
+        table_name="templates",
+        postgresql_using="gin",
+        postgresql_ops={"canvas_json": "jsonb_path_ops"},
+    )
+    op.drop_index(
+        "ix_templates_plan_json",
+        table_name="templates",
+        postgresql_using="gin",
+        postgresql_ops={"plan_json": "jsonb_path_ops"},
+    )
+    op.drop_index(
+        "ix_plan_versions_plan_json",
+        table_name="plan_versions",
+        postgresql_using="gin",
+        postgresql_ops={"plan_json": "jsonb_path_ops"},
+    )
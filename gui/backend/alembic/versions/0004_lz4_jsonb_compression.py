@@ -0,0 +1,40 @@
+"""Compress large JSONB columns with lz4
+
+Requires PostgreSQL 14+. Only newly written values are compressed with
+lz4; existing rows keep pglz until they are rewritten.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSONB_COLUMNS = {
+    "plan_versions": ("plan_json", "canvas_json"),
+    "templates": ("plan_json", "canvas_json"),
+    "node_logs": ("input_data", "output_data"),
+}
+
+
+def upgrade() -> None:
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+        op.execute(f"ALTER TABLE {table} SET (toast_tuple_target = 4096)")
+
+
+def downgrade() -> None:
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz")
+        op.execute(f"ALTER TABLE {table} RESET (toast_tuple_target)")
@@ -0,0 +1,82 @@
+"""Re-encrypt secrets under the HKDF-derived key
+
+Secrets used to be encrypted with settings.encryption_key zero-padded or
+truncated to 32 bytes. SecretManager now derives the key with HKDF-SHA256,
+so rows written under the old key are decrypted and encrypted again.
+Rows that do not decrypt under the old key are left alone, which makes the
+upgrade safe to re-run.
+
+Both key derivations are copied here so the migration keeps working if
+services/secret_manager.py changes.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+import os
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+NONCE_SIZE = 12
+
+
+def _legacy_key(secret: str) -> bytes:
+    """The pre-HKDF key: the secret zero-padded or truncated to 32 bytes."""
+    return secret.encode().ljust(32, b"0")[:32]
+
+
+def _derived_key(secret: str) -> bytes:
+    """The HKDF-SHA256 key used by SecretManager."""
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"maicrosoft-secret-v1",
+        info=b"aes-gcm",
+    )
+    return hkdf.derive(secret.encode())
+
+
+def _reencrypt(source: AESGCM, target: AESGCM) -> None:
+    """Move every secret that decrypts under source over to target."""
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, encrypted_value FROM secrets")).fetchall()
+    for secret_id, encrypted in rows:
+        try:
+            plaintext = source.decrypt(encrypted[:NONCE_SIZE], encrypted[NONCE_SIZE:], None)
+        except InvalidTag:
+            continue
+        nonce = os.urandom(NONCE_SIZE)
+        conn.execute(
+            sa.text("UPDATE secrets SET encrypted_value = :value WHERE id = :id"),
+            {"value": nonce + target.encrypt(nonce, plaintext, None), "id": secret_id},
+        )
+
+
+def upgrade() -> None:
+    _reencrypt(
+        AESGCM(_legacy_key(settings.encryption_key)),
+        AESGCM(_derived_key(settings.encryption_key)),
+    )
+
+
+def downgrade() -> None:
+    _reencrypt(
+        AESGCM(_derived_key(settings.encryption_key)),
+        AESGCM(_legacy_key(settings.encryption_key)),
+    )
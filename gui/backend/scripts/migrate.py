@@ -0,0 +1,17 @@
+"""Apply database migrations once, before the API workers start."""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def main() -> None:
+    """Upgrade the database schema to the latest revision."""
+    command.upgrade(Config(str(BACKEND_DIR / "alembic.ini")), "head")
+
+
+if __name__ == "__main__":
+    main()
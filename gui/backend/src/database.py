@@ -1,13 +1,63 @@
 """Database configuration and session management."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+
+import asyncpg
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from config import settings
 
 
-engine = create_async_engine(settings.database_url, echo=False)
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+engine = create_async_engine(
+    settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    connect_args={
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": 1024,
+    },
+    echo=False,
+)
+# One session per asyncio task; a request's dependencies share it.
+AsyncScopedSession = async_scoped_session(
+    async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    scopefunc=asyncio.current_task,
+)
+
+
+# Raw asyncpg pool for hot read endpoints; writes stay on SQLAlchemy.
+pg_pool: asyncpg.Pool | None = None
+
+
+async def init_pg_pool() -> None:
+    """Create the asyncpg pool. Called from the app lifespan."""
+    global pg_pool
+    dsn = make_url(settings.database_url).set(drivername="postgresql")
+    pg_pool = await asyncpg.create_pool(
+        dsn.render_as_string(hide_password=False),
+        min_size=settings.pg_pool_min_size,
+        max_size=settings.pg_pool_max_size,
+        statement_cache_size=1024,
+        server_settings={"jit": "off"},
+    )
+
+
+async def close_pg_pool() -> None:
+    """Close the asyncpg pool on shutdown."""
+    global pg_pool
+    if pg_pool is not None:
+        await pg_pool.close()
+        pg_pool = None
 
 
 class Base(DeclarativeBase):
@@ -16,11 +66,18 @@ class Base(DeclarativeBase):
 
 
 async def get_db() -> AsyncSession:
-    """Dependency for database session."""
-    async with async_session() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+    """Dependency for the request-scoped database session."""
+    session = AsyncScopedSession()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await AsyncScopedSession.remove()
+
+
+async def get_pg() -> asyncpg.Pool:
+    """Dependency for the raw asyncpg pool (read-only queries)."""
+    return pg_pool
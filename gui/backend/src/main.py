@@ -3,13 +3,20 @@
 Auto-generated from meta-plan.yaml
 """
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from config import settings
-from database import engine, Base
+from database import close_pg_pool, engine, init_pg_pool
+from middleware.db_session import DBSessionMiddleware
+from services import response_cache
+from services.agent_zero_client import agent_zero
 
 from routers.auth import router as auth_router
 from routers.plans import router as plans_router
@@ -22,19 +29,36 @@ from routers.github import router as github_router
 from routers.compile import router as compile_router
 
 
+logger = logging.getLogger(__name__)
+
+
+async def _warm_connection() -> None:
+    """Open one pooled connection so early requests skip the handshake."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup and shutdown events."""
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """Startup and shutdown events.
+
+    Schema changes are applied by scripts/migrate.py before workers start.
+    """
+    # Warm the connection pool
+    await asyncio.gather(*(_warm_connection() for _ in range(settings.db_pool_warm)))
+    logger.info("Database pool warmed: %s", engine.pool.status())
+    await init_pg_pool()
     yield
+    await close_pg_pool()
+    await response_cache.aclose()
+    await agent_zero.aclose()
 
 
 app = FastAPI(
     title="Maicrosoft GUI",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -45,6 +69,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(DBSessionMiddleware)
 
 # Include routers
 app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
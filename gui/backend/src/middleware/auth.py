@@ -1,27 +1,67 @@
 """JWT authentication middleware."""
 
+import hashlib
+import hmac
+import os
+import time
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Optional
 
+import anyio
+import bcrypt
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+JWT_DECODE_OPTIONS = {"require": ["exp", "sub"], "verify_aud": False}
+
+# Bounds concurrent bcrypt/JWT work so it spreads over cores without
+# exhausting the shared threadpool that sync endpoints rely on.
+_crypto_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+# HMAC verification is cheaper than a thread hop; only offload RSA/EC.
+_OFFLOAD_JWT_DECODE = not settings.jwt_algorithm.startswith("HS")
+
+# Recently verified passwords, keyed by hash -> (keyed digest of plaintext, expiry)
+VERIFY_CACHE_SIZE = 1024
+VERIFY_CACHE_TTL = 300  # seconds
+_verify_key = os.urandom(32)
+_verified: dict[str, tuple[bytes, float]] = {}
+
+# Decoded token payloads, keyed by token digest -> (payload, exp)
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL = 60  # seconds
+_token_cache: TTLCache = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL)
+
 
 def hash_password(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
 
 
-def verify_password(plain: str, hashed: str) -> bool:
+async def verify_password(plain: str, hashed: str) -> bool:
     """Verify password against hash."""
-    return pwd_context.verify(plain, hashed)
+    digest = hashlib.blake2b(plain.encode(), key=_verify_key, digest_size=16).digest()
+    cached = _verified.get(hashed)
+    if cached is not None and cached[1] > time.monotonic():
+        if hmac.compare_digest(cached[0], digest):
+            return True
+
+    valid = await anyio.to_thread.run_sync(
+        bcrypt.checkpw, plain.encode(), hashed.encode(), limiter=_crypto_limiter
+    )
+    if valid:
+        if len(_verified) >= VERIFY_CACHE_SIZE:
+            _verified.pop(next(iter(_verified)))
+        _verified[hashed] = (digest, time.monotonic() + VERIFY_CACHE_TTL)
+    return valid
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -34,15 +74,31 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current user from JWT token."""
-    try:
-        payload = jwt.decode(
-            credentials.credentials,
+    token = credentials.credentials
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    cached = _token_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        payload = cached[0]
+    else:
+        decode = partial(
+            jwt.decode,
+            token,
             settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm]
+            algorithms=[settings.jwt_algorithm],
+            options=JWT_DECODE_OPTIONS,
         )
-        user_id = payload.get("sub")
-        if user_id is None:
+        try:
+            if _OFFLOAD_JWT_DECODE:
+                payload = await anyio.to_thread.run_sync(decode, limiter=_crypto_limiter)
+            else:
+                payload = decode()
+        except jwt.InvalidTokenError:
+            _token_cache.pop(key, None)
             raise HTTPException(status_code=401, detail="Invalid token")
-        return {"id": user_id, "role": payload.get("role", "viewer")}
-    except JWTError:
+        _token_cache[key] = (payload, payload.get("exp") or time.time() + TOKEN_CACHE_TTL)
+
+    user_id = payload.get("sub")
+    if user_id is None:
         raise HTTPException(status_code=401, detail="Invalid token")
+    return {"id": user_id, "role": payload.get("role", "viewer")}
@@ -0,0 +1,25 @@
+"""Request-scoped database session cleanup."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from database import AsyncScopedSession
+
+
+class DBSessionMiddleware:
+    """Remove the task-scoped session once a request finishes.
+
+    Plain ASGI rather than BaseHTTPMiddleware, so it runs in the same task
+    as the endpoint and releases the same scoped session.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await AsyncScopedSession.remove()
@@ -12,8 +12,15 @@ ROLE_HIERARCHY = {
 }
 
 
+def _required_level(roles: list[str]) -> int:
+    """Lowest hierarchy level that satisfies any of the given roles."""
+    return min((ROLE_HIERARCHY[r] for r in roles), default=ROLE_HIERARCHY["admin"])
+
+
 def require_role(allowed_roles: list[str]):
-    """Decorator to require specific roles."""
+    """Decorator to require specific roles (or any role above them)."""
+    required_level = _required_level(allowed_roles)
+
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, current_user: dict = None, **kwargs):
@@ -21,7 +28,7 @@ def require_role(allowed_roles: list[str]):
                 raise HTTPException(status_code=401, detail="Not authenticated")
 
             user_role = current_user.get("role", "viewer")
-            if user_role not in allowed_roles and user_role != "admin":
+            if ROLE_HIERARCHY.get(user_role, 0) < required_level:
                 raise HTTPException(status_code=403, detail="Insufficient permissions")
 
             return await func(*args, current_user=current_user, **kwargs)
@@ -31,6 +38,4 @@ def require_role(allowed_roles: list[str]):
 
 def can_access(user_role: str, required_roles: list[str]) -> bool:
     """Check if user role can access resource."""
-    if user_role == "admin":
-        return True
-    return user_role in required_roles
+    return ROLE_HIERARCHY.get(user_role, 0) >= _required_level(required_roles)
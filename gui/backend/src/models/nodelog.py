@@ -5,6 +5,7 @@ from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import String
 from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import JSONB
@@ -15,11 +16,18 @@ class NodeLog(Base):
     """SQLAlchemy model for node_logs."""
 
     __tablename__ = "node_logs"
+    __table_args__ = (
+        Index("ix_node_logs_run_id", "run_id"),
+        Index("ix_node_logs_node_id", "node_id"),
+        Index("ix_node_logs_started_at", "started_at", postgresql_using="brin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
-    run_id = Column(UUID(as_uuid=True), ForeignKey("runhistorys.id", ondelete="CASCADE"))
+    run_id = Column(UUID(as_uuid=True), ForeignKey("run_history.id", ondelete="CASCADE"))
     node_id = Column(String(255), nullable=False)
-    status = Column(Enum('pending', 'running', 'completed', 'failed', 'skipped', name='enum_type'))
+    status = Column(
+        Enum('pending', 'running', 'completed', 'failed', 'skipped', name='node_logs_status')
+    )
     input_data = Column(JSONB)
     output_data = Column(JSONB)
     error_data = Column(JSONB)
@@ -5,6 +5,7 @@ from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import String
 from sqlalchemy import Text
 from sqlalchemy import func
@@ -15,6 +16,10 @@ class Plan(Base):
     """SQLAlchemy model for plans."""
 
     __tablename__ = "plans"
+    __table_args__ = (
+        Index("ix_plans_owner_id", "owner_id"),
+        Index("ix_plans_is_active", "is_active"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(255), nullable=False)
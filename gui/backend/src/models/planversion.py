@@ -4,6 +4,7 @@ from database import Base
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import JSONB
@@ -14,6 +15,14 @@ class PlanVersion(Base):
     """SQLAlchemy model for plan_versions."""
 
     __tablename__ = "plan_versions"
+    __table_args__ = (
+        Index(
+            "ix_plan_versions_plan_json",
+            "plan_json",
+            postgresql_using="gin",
+            postgresql_ops={"plan_json": "jsonb_path_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     plan_id = Column(UUID(as_uuid=True), ForeignKey("plans.id", ondelete="CASCADE"))
@@ -5,6 +5,7 @@ from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Text
 from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import UUID
@@ -14,12 +15,19 @@ class RunHistory(Base):
     """SQLAlchemy model for run_history."""
 
     __tablename__ = "run_history"
+    __table_args__ = (
+        Index("ix_run_history_plan_id", "plan_id"),
+        Index("ix_run_history_status", "status"),
+        Index("ix_run_history_started_at", "started_at", postgresql_using="brin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     plan_id = Column(UUID(as_uuid=True), ForeignKey("plans.id"))
-    version_id = Column(UUID(as_uuid=True), ForeignKey("planversions.id"))
-    status = Column(Enum('pending', 'running', 'completed', 'failed', 'cancelled', name='enum_type'))
-    trigger_type = Column(Enum('manual', 'webhook', 'schedule', name='enum_type'))
+    version_id = Column(UUID(as_uuid=True), ForeignKey("plan_versions.id"))
+    status = Column(
+        Enum('pending', 'running', 'completed', 'failed', 'cancelled', name='run_history_status')
+    )
+    trigger_type = Column(Enum('manual', 'webhook', 'schedule', name='run_history_trigger_type'))
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True))
     error_message = Column(Text)
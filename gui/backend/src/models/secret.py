@@ -19,6 +19,8 @@ class Secret(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(255), nullable=False)
     encrypted_value = Column(LargeBinary, nullable=False)
-    secret_type = Column(Enum('api_key', 'oauth', 'password', 'connection_string', name='enum_type'))
+    secret_type = Column(
+        Enum('api_key', 'oauth', 'password', 'connection_string', name='secrets_secret_type')
+    )
     owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
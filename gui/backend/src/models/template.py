@@ -3,6 +3,7 @@
 from database import Base
 from sqlalchemy import Boolean
 from sqlalchemy import Column
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import Text
@@ -15,6 +16,20 @@ class Template(Base):
     """SQLAlchemy model for templates."""
 
     __tablename__ = "templates"
+    __table_args__ = (
+        Index(
+            "ix_templates_plan_json",
+            "plan_json",
+            postgresql_using="gin",
+            postgresql_ops={"plan_json": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_templates_canvas_json",
+            "canvas_json",
+            postgresql_using="gin",
+            postgresql_ops={"canvas_json": "jsonb_path_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(255), nullable=False)
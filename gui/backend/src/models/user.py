@@ -18,5 +18,5 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False)
     password_hash = Column(String(255))
     name = Column(String(255))
-    role = Column(Enum('admin', 'owner', 'editor', 'viewer', name='enum_type'), default='viewer')
+    role = Column(Enum('admin', 'owner', 'editor', 'viewer', name='users_role'), default='viewer')
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,16 +1,28 @@
 """Plans router."""
 
+from uuid import UUID
+
+import asyncpg
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from database import get_db
+from database import get_db, get_pg
+from middleware.auth import get_current_user
 
 router = APIRouter()
 
 @router.get("/plans")
-async def list_plans(db: AsyncSession = Depends(get_db)):
+async def list_plans(
+    user: dict = Depends(get_current_user),
+    pg: asyncpg.Pool = Depends(get_pg),
+):
     """Handler for GET /plans."""
-    # TODO: Implement list_plans
-    return {"message": "Not implemented"}
+    rows = await pg.fetch(
+        "SELECT id, name, current_version_id FROM plans "
+        "WHERE owner_id = $1 AND is_active ORDER BY updated_at DESC",
+        UUID(user["id"]),
+    )
+    return [dict(row) for row in rows]
 
 
 @router.post("/plans")
@@ -21,10 +33,26 @@ async def create_plan(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/plans/{id}")
-async def get_plan(db: AsyncSession = Depends(get_db)):
-    """Handler for GET /plans/{id}."""
-    # TODO: Implement get_plan
-    return {"message": "Not implemented"}
+async def get_plan(
+    id: UUID,
+    user: dict = Depends(get_current_user),
+    pg: asyncpg.Pool = Depends(get_pg),
+):
+    """Handler for GET /plans/{id}.
+
+    Returns {plan, version} for the current version, built by Postgres as
+    text so the payload is never decoded into Python objects and re-encoded.
+    """
+    body = await pg.fetchval(
+        "SELECT json_build_object('plan', row_to_json(p), 'version', row_to_json(pv))::text "
+        "FROM plans p LEFT JOIN plan_versions pv ON pv.id = p.current_version_id "
+        "WHERE p.id = $1 AND p.owner_id = $2",
+        id,
+        UUID(user["id"]),
+    )
+    if body is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
+    return Response(content=body, media_type="application/json")
 
 
 @router.put("/plans/{id}")
@@ -42,10 +70,24 @@ async def delete_plan(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/plans/{id}/versions")
-async def list_versions(db: AsyncSession = Depends(get_db)):
-    """Handler for GET /plans/{id}/versions."""
-    # TODO: Implement list_versions
-    return {"message": "Not implemented"}
+async def list_versions(
+    id: UUID,
+    user: dict = Depends(get_current_user),
+    pg: asyncpg.Pool = Depends(get_pg),
+):
+    """Handler for GET /plans/{id}/versions.
+
+    The JSON array is aggregated in Postgres and passed through as text.
+    """
+    versions_json = await pg.fetchval(
+        "SELECT coalesce(json_agg(v ORDER BY v.version_number), '[]')::text FROM ("
+        "SELECT pv.id, pv.version_number, pv.plan_json, pv.canvas_json, pv.created_by, "
+        "pv.created_at FROM plan_versions pv JOIN plans p ON p.id = pv.plan_id "
+        "WHERE pv.plan_id = $1 AND p.owner_id = $2) v",
+        id,
+        UUID(user["id"]),
+    )
+    return Response(content=versions_json, media_type="application/json")
 
 
 @router.post("/plans/{id}/versions")
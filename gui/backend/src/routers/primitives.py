@@ -1,16 +1,31 @@
 """Primitives router."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
+from services import response_cache
+from services.maicrosoft_bridge import bridge
 
 router = APIRouter()
 
 @router.get("/primitives")
-async def list_primitives(db: AsyncSession = Depends(get_db)):
-    """Handler for GET /primitives."""
-    # TODO: Implement list_primitives
-    return {"message": "Not implemented"}
+async def list_primitives(
+    category: str | None = None,
+    status_filter: str = Query("stable", alias="status"),
+):
+    """Handler for GET /primitives.
+
+    The encoded catalog is cached in Redis for response_cache.CACHE_TTL.
+    """
+    category = category or None
+    key = response_cache.cache_key("primitives:v1", category, status_filter)
+    body = await response_cache.get_cached(key)
+    if body is None:
+        body = orjson.dumps(bridge.list_primitives(category=category, status=status_filter))
+        await response_cache.set_cached(key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/primitives/{id}")
@@ -1,16 +1,33 @@
 """Templates router."""
 
+import asyncpg
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from database import get_db
+from database import get_db, get_pg
+from services import response_cache
 
 router = APIRouter()
 
 @router.get("/templates")
-async def list_templates(db: AsyncSession = Depends(get_db)):
-    """Handler for GET /templates."""
-    # TODO: Implement list_templates
-    return {"message": "Not implemented"}
+async def list_templates(category: str | None = None, pg: asyncpg.Pool = Depends(get_pg)):
+    """Handler for GET /templates.
+
+    The JSON array is built in Postgres and cached in Redis as raw bytes.
+    """
+    category = category or None
+    key = response_cache.cache_key("templates:v1", category)
+    body = await response_cache.get_cached(key)
+    if body is None:
+        templates_json = await pg.fetchval(
+            "SELECT coalesce(json_agg(t ORDER BY t.usage_count DESC), '[]')::text FROM ("
+            "SELECT id, name, category, description, usage_count FROM templates "
+            "WHERE is_public AND ($1::text IS NULL OR category = $1)) t",
+            category,
+        )
+        body = templates_json.encode()
+        await response_cache.set_cached(key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/templates/{id}")
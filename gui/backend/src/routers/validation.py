@@ -3,7 +3,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
+import orjson
 
 router = APIRouter()
 
@@ -16,14 +17,24 @@ async def validate_plan(db: AsyncSession = Depends(get_db)):
 
 @router.websocket("/ws/validate")
 async def validation_stream(websocket: WebSocket):
-    """WebSocket handler for /ws/validate."""
+    """WebSocket handler for /ws/validate.
+
+    Accepts JSON in text or binary frames; replies are binary.
+    """
     await websocket.accept()
     try:
         while True:
-            data = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            try:
+                data = orjson.loads(message.get("bytes") or message.get("text") or b"")
+            except orjson.JSONDecodeError:
+                await websocket.send_bytes(orjson.dumps({"status": "error", "detail": "invalid JSON"}))
+                continue
             # TODO: Implement validation_stream
-            await websocket.send_json({"status": "received"})
-    except Exception:
+            await websocket.send_bytes(orjson.dumps({"status": "received"}))
+    except WebSocketDisconnect:
         pass
 
 
@@ -10,6 +10,15 @@ class AgentZeroClient:
 
     def __init__(self):
         self.mcp_url = settings.agent_zero_mcp_url
+        self._client = httpx.AsyncClient(
+            timeout=120.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
 
     async def analyze_github_repo(self, repo_url: str, branch: str = "main") -> dict:
         """
@@ -22,20 +31,19 @@ class AgentZeroClient:
         - coverage_estimate: percentage of code covered by primitives
         - gaps: list of functionality gaps
         """
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                self.mcp_url,
-                json={
-                    "method": "analyze_repository",
-                    "params": {
-                        "repo_url": repo_url,
-                        "branch": branch,
-                        "analysis_type": "primitives_conversion",
-                    }
+        response = await self._client.post(
+            self.mcp_url,
+            json={
+                "method": "analyze_repository",
+                "params": {
+                    "repo_url": repo_url,
+                    "branch": branch,
+                    "analysis_type": "primitives_conversion",
                 }
-            )
-            response.raise_for_status()
-            return response.json()
+            }
+        )
+        response.raise_for_status()
+        return response.json()
 
 
 agent_zero = AgentZeroClient()
@@ -0,0 +1,49 @@
+"""Redis cache for serialized catalog responses.
+
+The cached catalogs have no write routes, so entries only expire after
+CACHE_TTL. A route that changes a cached resource must delete its keys.
+"""
+
+import json
+import logging
+
+import redis.asyncio as redis
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = 60  # seconds
+
+_redis = redis.Redis.from_url(settings.redis_url)
+
+
+def cache_key(namespace: str, *filters: str | None) -> str:
+    """Build a key for namespace and its query filters.
+
+    Empty strings count as no filter, and the filters are JSON-encoded so
+    that no filter value can collide with another or with "no filter".
+    """
+    return f"{namespace}:{json.dumps([f or None for f in filters])}"
+
+
+async def get_cached(key: str) -> bytes | None:
+    """Return the cached response body, or None on a miss or Redis error."""
+    try:
+        return await _redis.get(key)
+    except redis.RedisError:
+        logger.warning("Response cache read failed for %s", key, exc_info=True)
+        return None
+
+
+async def set_cached(key: str, body: bytes, ttl: int = CACHE_TTL) -> None:
+    """Store an encoded response body under key for ttl seconds."""
+    try:
+        await _redis.set(key, body, ex=ttl)
+    except redis.RedisError:
+        logger.warning("Response cache write failed for %s", key, exc_info=True)
+
+
+async def aclose() -> None:
+    """Close the Redis connection pool."""
+    await _redis.aclose()
@@ -1,31 +1,50 @@
 """Secret management with AES-256-GCM encryption."""
 
 import os
+
+from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from config import settings
 
+NONCE_SIZE = 12
+
+
+def _derive_key(secret: str) -> bytes:
+    """Derive the 32-byte AES key from the configured encryption key.
+
+    Alembic revision 0005 re-encrypts secrets stored under the earlier
+    zero-padded key.
+    """
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"maicrosoft-secret-v1",
+        info=b"aes-gcm",
+    )
+    return hkdf.derive(secret.encode())
+
+
+_aesgcm = AESGCM(_derive_key(settings.encryption_key))
+
 
 class SecretManager:
     """Manages encrypted secrets."""
 
     def __init__(self):
-        key = settings.encryption_key.encode()
-        if len(key) < 32:
-            key = key.ljust(32, b"0")
-        self.aesgcm = AESGCM(key[:32])
+        self.aesgcm = _aesgcm
 
     def encrypt(self, plaintext: str) -> bytes:
         """Encrypt a secret value."""
-        nonce = os.urandom(12)
+        nonce = os.urandom(NONCE_SIZE)
         ciphertext = self.aesgcm.encrypt(nonce, plaintext.encode(), None)
         return nonce + ciphertext
 
     def decrypt(self, encrypted: bytes) -> str:
         """Decrypt a secret value."""
-        nonce = encrypted[:12]
-        ciphertext = encrypted[12:]
-        plaintext = self.aesgcm.decrypt(nonce, ciphertext, None)
+        view = memoryview(encrypted)
+        plaintext = self.aesgcm.decrypt(view[:NONCE_SIZE], view[NONCE_SIZE:], None)
         return plaintext.decode()
 
 
@@ -1,30 +1,66 @@
-import axios from 'axios'
 import { useAuthStore } from '../stores/authStore'
 
-const api = axios.create({
-  baseURL: '/api',
-})
+const BASE_URL = '/api'
+const TIMEOUT_MS = 30000
 
-// Add auth token to requests
-api.interceptors.request.use((config) => {
+// Responses keep axios' { data } shape, so callers read response.data
+export interface ApiResponse<T = any> {
+  data: T
+  status: number
+}
+
+type Params = Record<string, string | number | boolean | undefined>
+
+async function request<T = any>(
+  method: string,
+  path: string,
+  body?: unknown,
+  params?: Params
+): Promise<ApiResponse<T>> {
+  let url = `${BASE_URL}${path}`
+  if (params) {
+    const query = new URLSearchParams()
+    for (const [key, value] of Object.entries(params)) {
+      if (value !== undefined) query.set(key, String(value))
+    }
+    const qs = query.toString()
+    if (qs) url += `?${qs}`
+  }
+
+  const headers: Record<string, string> = {}
+  if (body !== undefined) headers['Content-Type'] = 'application/json'
+
+  // Add auth token to requests
   const token = useAuthStore.getState().token
-  if (token) {
-    config.headers.Authorization = `Bearer ${token}`
+  if (token) headers.Authorization = `Bearer ${token}`
+
+  const res = await fetch(url, {
+    method,
+    headers,
+    body: body === undefined ? undefined : JSON.stringify(body),
+    signal: AbortSignal.timeout(TIMEOUT_MS),
+  })
+
+  // Handle 401 responses
+  if (res.status === 401) {
+    useAuthStore.getState().logout()
+    window.location.href = '/login'
   }
-  return config
-})
-
-// Handle 401 responses
-api.interceptors.response.use(
-  (response) => response,
-  (error) => {
-    if (error.response?.status === 401) {
-      useAuthStore.getState().logout()
-      window.location.href = '/login'
-    }
-    return Promise.reject(error)
+  if (!res.ok) {
+    throw new Error(`${method} ${path} failed with HTTP ${res.status}`)
   }
-)
+
+  const data = res.status === 204 ? null : await res.json()
+  return { data, status: res.status }
+}
+
+const api = {
+  get: <T = any>(path: string, options?: { params?: Params }) =>
+    request<T>('GET', path, undefined, options?.params),
+  post: <T = any>(path: string, body?: unknown) => request<T>('POST', path, body),
+  put: <T = any>(path: string, body?: unknown) => request<T>('PUT', path, body),
+  delete: <T = any>(path: string) => request<T>('DELETE', path),
+}
 
 export default api
 
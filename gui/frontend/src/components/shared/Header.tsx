@@ -1,16 +1,19 @@
+import { memo } from 'react'
 import { useAuthStore } from '../../stores/authStore'
 
-export default function Header() {
-  const { user, logout } = useAuthStore()
+function Header() {
+  // The email string, not the user object, so only a changed address re-renders
+  const email = useAuthStore((s) => s.user?.email)
+  const logout = useAuthStore.use.logout()
 
   return (
     <header className="bg-white shadow-sm border-b">
       <div className="flex items-center justify-between px-6 py-4">
         <div></div>
         <div className="flex items-center gap-4">
-          {user && (
+          {email && (
             <>
-              <span className="text-sm text-gray-600">{user.email}</span>
+              <span className="text-sm text-gray-600">{email}</span>
               <button
                 onClick={logout}
                 className="text-sm text-red-600 hover:text-red-800"
@@ -24,3 +27,5 @@ export default function Header() {
     </header>
   )
 }
+
+export default memo(Header)
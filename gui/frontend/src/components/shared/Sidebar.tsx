@@ -1,3 +1,4 @@
+import { memo } from 'react'
 import { Link, useLocation } from 'react-router-dom'
 import {
   HomeIcon,
@@ -20,7 +21,25 @@ const navigation = [
   { name: 'Settings', href: '/settings', icon: Cog6ToothIcon },
 ]
 
-export default function Sidebar() {
+type NavEntry = (typeof navigation)[number]
+
+// Only the items whose active state flips re-render on navigation
+const NavItem = memo(function NavItem({ item, active }: { item: NavEntry; active: boolean }) {
+  return (
+    <Link
+      to={item.href}
+      className={clsx(
+        'flex items-center px-4 py-3 text-sm',
+        active ? 'bg-gray-800 text-white' : 'text-gray-300 hover:bg-gray-800'
+      )}
+    >
+      <item.icon className="w-5 h-5 mr-3" />
+      {item.name}
+    </Link>
+  )
+})
+
+function Sidebar() {
   const location = useLocation()
 
   return (
@@ -31,21 +50,11 @@ export default function Sidebar() {
       </div>
       <nav className="mt-4">
         {navigation.map((item) => (
-          <Link
-            key={item.name}
-            to={item.href}
-            className={clsx(
-              'flex items-center px-4 py-3 text-sm',
-              location.pathname === item.href
-                ? 'bg-gray-800 text-white'
-                : 'text-gray-300 hover:bg-gray-800'
-            )}
-          >
-            <item.icon className="w-5 h-5 mr-3" />
-            {item.name}
-          </Link>
+          <NavItem key={item.name} item={item} active={location.pathname === item.href} />
         ))}
       </nav>
     </div>
   )
 }
+
+export default memo(Sidebar)
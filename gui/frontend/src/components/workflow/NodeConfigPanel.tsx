@@ -8,6 +8,7 @@ import { useQuery } from '@tanstack/react-query'
 import { XMarkIcon, InformationCircleIcon } from '@heroicons/react/24/outline'
 import { Node } from '@xyflow/react'
 import { primitivesApi } from '../../api/client'
+import { useShallow } from 'zustand/react/shallow'
 import { useWorkflowStore } from '../../stores/workflowStore'
 
 interface NodeConfigPanelProps {
@@ -32,7 +33,9 @@ interface PrimitiveInterface {
 }
 
 export default function NodeConfigPanel({ node, onClose }: NodeConfigPanelProps) {
-  const { nodes, setNodes } = useWorkflowStore()
+  const { nodes, setNodes } = useWorkflowStore(
+    useShallow((s) => ({ nodes: s.nodes, setNodes: s.setNodes }))
+  )
   const [inputs, setInputs] = useState<Record<string, any>>({})
 
   // Fetch primitive definition
@@ -19,6 +19,7 @@ import {
 } from '@xyflow/react'
 import '@xyflow/react/dist/style.css'
 
+import { useShallow } from 'zustand/react/shallow'
 import { useWorkflowStore } from '../../stores/workflowStore'
 import ParticleNode from './ParticleNode'
 import TriggerNode from './TriggerNode'
@@ -57,7 +58,17 @@ export default function WorkflowCanvas({ onNodeSelect, readOnly = false }: Workf
     onConnect,
     selectNode,
     addNode,
-  } = useWorkflowStore()
+  } = useWorkflowStore(
+    useShallow((s) => ({
+      nodes: s.nodes,
+      edges: s.edges,
+      onNodesChange: s.onNodesChange,
+      onEdgesChange: s.onEdgesChange,
+      onConnect: s.onConnect,
+      selectNode: s.selectNode,
+      addNode: s.addNode,
+    }))
+  )
 
   // Handle node selection
   const handleNodeClick = useCallback((_: any, node: Node) => {
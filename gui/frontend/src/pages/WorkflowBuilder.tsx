@@ -18,6 +18,7 @@ import { Node } from '@xyflow/react'
 import WorkflowCanvas from '../components/workflow/WorkflowCanvas'
 import NodePalette from '../components/workflow/NodePalette'
 import NodeConfigPanel from '../components/workflow/NodeConfigPanel'
+import { useShallow } from 'zustand/react/shallow'
 import { useWorkflowStore } from '../stores/workflowStore'
 import { plansApi, validationApi, compileApi } from '../api/client'
 
@@ -26,7 +27,14 @@ export default function WorkflowBuilder() {
   const navigate = useNavigate()
   const queryClient = useQueryClient()
 
-  const { nodes, edges, setNodes, setEdges } = useWorkflowStore()
+  const { nodes, edges, setNodes, setEdges } = useWorkflowStore(
+    useShallow((s) => ({
+      nodes: s.nodes,
+      edges: s.edges,
+      setNodes: s.setNodes,
+      setEdges: s.setEdges,
+    }))
+  )
   const [selectedNode, setSelectedNode] = useState<Node | null>(null)
   const [planName, setPlanName] = useState('New Workflow')
   const [isSaving, setIsSaving] = useState(false)
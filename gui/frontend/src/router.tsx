@@ -0,0 +1,49 @@
+import { lazy, Suspense } from 'react'
+import { Routes, Route } from 'react-router-dom'
+import Spinner from './components/shared/Spinner'
+
+// Pages are split into their own chunks and loaded on first visit
+const Dashboard = lazy(() => import('./pages/Dashboard'))
+const Login = lazy(() => import('./pages/Login'))
+const Register = lazy(() => import('./pages/Register'))
+const WorkflowList = lazy(() => import('./pages/WorkflowList'))
+const WorkflowBuilder = lazy(() => import('./pages/WorkflowBuilder'))
+const RunHistory = lazy(() => import('./pages/RunHistory'))
+const RunDetails = lazy(() => import('./pages/RunDetails'))
+const TemplateGallery = lazy(() => import('./pages/TemplateGallery'))
+const SecretManager = lazy(() => import('./pages/SecretManager'))
+const Settings = lazy(() => import('./pages/Settings'))
+const GitHubAnalyzer = lazy(() => import('./pages/GitHubAnalyzer'))
+
+// Likely next pages are fetched once the browser is idle, so their first visit
+// does not wait on the network; lazy() reuses the already loaded chunk
+const preload = () => {
+  import('./pages/Dashboard')
+  import('./pages/WorkflowList')
+}
+if ('requestIdleCallback' in window) {
+  window.requestIdleCallback(preload)
+} else {
+  setTimeout(preload, 1)
+}
+
+export default function AppRoutes() {
+  return (
+    <Suspense fallback={<Spinner />}>
+      <Routes>
+        <Route path="/" element={<Dashboard />} />
+        <Route path="/login" element={<Login />} />
+        <Route path="/register" element={<Register />} />
+        <Route path="/workflows" element={<WorkflowList />} />
+        <Route path="/workflows/new" element={<WorkflowBuilder />} />
+        <Route path="/workflows/{id}" element={<WorkflowBuilder />} />
+        <Route path="/runs" element={<RunHistory />} />
+        <Route path="/runs/{id}" element={<RunDetails />} />
+        <Route path="/templates" element={<TemplateGallery />} />
+        <Route path="/secrets" element={<SecretManager />} />
+        <Route path="/settings" element={<Settings />} />
+        <Route path="/analyze" element={<GitHubAnalyzer />} />
+      </Routes>
+    </Suspense>
+  )
+}
@@ -1,5 +1,6 @@
 import { create } from 'zustand'
 import { persist } from 'zustand/middleware'
+import { createSelectors } from '../utils/createSelectors'
 
 interface User {
   id: string
@@ -16,7 +17,7 @@ interface AuthState {
   isAuthenticated: () => boolean
 }
 
-export const useAuthStore = create<AuthState>()(
+const useAuthStoreBase = create<AuthState>()(
   persist(
     (set, get) => ({
       user: null,
@@ -31,3 +32,5 @@ export const useAuthStore = create<AuthState>()(
     { name: 'auth-storage' }
   )
 )
+
+export const useAuthStore = createSelectors(useAuthStoreBase)
@@ -0,0 +1,43 @@
+import { createSelector } from 'reselect'
+import { Edge, Node } from '@xyflow/react'
+import type { WorkflowState } from './workflowStore'
+
+// Input selectors return store slices by reference, so derived selectors only
+// recompute (and only hand out new arrays) when nodes or edges actually change
+const selectNodes = (s: WorkflowState) => s.nodes
+const selectNodeMap = (s: WorkflowState) => s.nodeMap
+const selectEdges = (s: WorkflowState) => s.edges
+const selectSelected = (s: WorkflowState) => s.selectedNode
+
+// The current version of the selected node, which may have moved or been edited
+export const selectSelectedNode = createSelector(
+  [selectNodeMap, selectSelected],
+  (nodeMap, selected) => (selected ? nodeMap.get(selected.id) ?? null : null)
+)
+
+type NodeSelector = (s: WorkflowState) => Node[]
+type EdgeSelector = (s: WorkflowState) => Edge[]
+
+// One memoized selector per argument; a fresh selector per call would never hit its cache
+const byType = new Map<string, NodeSelector>()
+const byNode = new Map<string, EdgeSelector>()
+
+export const selectNodesByType = (type: string): NodeSelector => {
+  let selector = byType.get(type)
+  if (!selector) {
+    selector = createSelector([selectNodes], (nodes) => nodes.filter((n) => n.type === type))
+    byType.set(type, selector)
+  }
+  return selector
+}
+
+export const selectEdgesForNode = (nodeId: string): EdgeSelector => {
+  let selector = byNode.get(nodeId)
+  if (!selector) {
+    selector = createSelector([selectEdges], (edges) =>
+      edges.filter((e) => e.source === nodeId || e.target === nodeId)
+    )
+    byNode.set(nodeId, selector)
+  }
+  return selector
+}
@@ -1,8 +1,11 @@
 import { create } from 'zustand'
 import { Node, Edge, addEdge, applyNodeChanges, applyEdgeChanges } from '@xyflow/react'
+import { createSelectors } from '../utils/createSelectors'
 
-interface WorkflowState {
+export interface WorkflowState {
   nodes: Node[]
+  // Nodes by id, kept in sync with nodes for constant-time lookups
+  nodeMap: Map<string, Node>
   edges: Edge[]
   selectedNode: Node | null
   setNodes: (nodes: Node[]) => void
@@ -14,16 +17,20 @@ interface WorkflowState {
   addNode: (node: Node) => void
 }
 
-export const useWorkflowStore = create<WorkflowState>((set, get) => ({
+const indexNodes = (nodes: Node[]) => new Map(nodes.map((n) => [n.id, n]))
+
+const useWorkflowStoreBase = create<WorkflowState>((set, get) => ({
   nodes: [],
+  nodeMap: new Map(),
   edges: [],
   selectedNode: null,
 
-  setNodes: (nodes) => set({ nodes }),
+  setNodes: (nodes) => set({ nodes, nodeMap: indexNodes(nodes) }),
   setEdges: (edges) => set({ edges }),
 
   onNodesChange: (changes) => {
-    set({ nodes: applyNodeChanges(changes, get().nodes) })
+    const nodes = applyNodeChanges(changes, get().nodes)
+    set({ nodes, nodeMap: indexNodes(nodes) })
   },
 
   onEdgesChange: (changes) => {
@@ -36,5 +43,14 @@ export const useWorkflowStore = create<WorkflowState>((set, get) => ({
 
   selectNode: (node) => set({ selectedNode: node }),
 
-  addNode: (node) => set({ nodes: [...get().nodes, node] }),
+  addNode: (node) =>
+    set((s) => {
+      const nodeMap = new Map(s.nodeMap)
+      nodeMap.set(node.id, node)
+      return { nodes: [...s.nodes, node], nodeMap }
+    }),
 }))
+
+export const useWorkflowStore = createSelectors(useWorkflowStoreBase)
+
+export const useNodeById = (id: string) => useWorkflowStore((s) => s.nodeMap.get(id))
@@ -3,6 +3,26 @@ import react from '@vitejs/plugin-react'
 
 export default defineConfig({
   plugins: [react()],
+  build: {
+    target: 'es2020',
+    minify: 'esbuild',
+    cssCodeSplit: true,
+    rollupOptions: {
+      output: {
+        // Libraries change less often than app code, so they get their own cached
+        // chunks, grouped by how often they are upgraded
+        manualChunks: {
+          'react-vendor': ['react', 'react-dom', 'react-router-dom'],
+          'state-vendor': ['zustand', 'reselect', '@tanstack/react-query'],
+          'ui-vendor': ['@headlessui/react', '@heroicons/react', 'clsx'],
+          'flow-vendor': ['@xyflow/react'],
+        },
+      },
+    },
+  },
+  esbuild: {
+    legalComments: 'none',
+  },
   server: {
     port: 5173,
     proxy: {
@@ -8,9 +8,12 @@ from pre-validated building blocks instead of generating arbitrary code.
 __version__ = "0.1.0"
 __author__ = "BORG.tools"
 
-from maicrosoft.core.models import Plan, PlanNode, Particle, Atom
-from maicrosoft.registry.loader import PrimitiveLoader
-from maicrosoft.registry.registry import PrimitiveRegistry
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from maicrosoft.core.models import Plan, PlanNode, Particle, Atom
+    from maicrosoft.registry.loader import PrimitiveLoader
+    from maicrosoft.registry.registry import PrimitiveRegistry
 
 __all__ = [
     "Plan",
@@ -20,3 +23,23 @@ __all__ = [
     "PrimitiveLoader",
     "PrimitiveRegistry",
 ]
+
+# Resolved on first access so `import maicrosoft.cli` does not load pydantic
+_LAZY_IMPORTS = {
+    "Plan": "maicrosoft.core.models",
+    "PlanNode": "maicrosoft.core.models",
+    "Particle": "maicrosoft.core.models",
+    "Atom": "maicrosoft.core.models",
+    "PrimitiveLoader": "maicrosoft.registry.loader",
+    "PrimitiveRegistry": "maicrosoft.registry.registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,33 @@
+"""Console entry point for `maicrosoft` and `python -m maicrosoft`.
+
+Trivial commands are answered here, before typer, click and rich are
+imported; everything else is dispatched to the typer app in cli.py.
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def print_version() -> None:
+    """Print version information."""
+    from maicrosoft import __version__
+
+    print(f"Maicrosoft v{__version__}")
+    print("Framework for Hallucination-Free AI Coding")
+    print("Created by The Collective BORG.tools")
+
+
+def main() -> None:
+    """Main entry point."""
+    if sys.argv[1:] == ["version"]:
+        print_version()
+        return
+
+    from maicrosoft.cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
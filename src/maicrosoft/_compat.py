@@ -0,0 +1,8 @@
+"""Optional dependencies shared by the CLI and the compilers."""
+
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["orjson"]
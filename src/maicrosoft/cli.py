@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import os
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
-import yaml
 
-from maicrosoft.core.models import Plan, PlanMetadata, PlanSettings
-from maicrosoft.registry.registry import PrimitiveRegistry
-from maicrosoft.validation.validator import PlanValidator
-from maicrosoft.compiler import N8NCompiler
+# rich, yaml and the maicrosoft modules are imported inside the commands
+# that need them, so --help and version start without loading them.
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from rich.console import Console
+    from rich.text import Text
+
+    from maicrosoft.core.models import Plan, ValidationResult
+    from maicrosoft.llm import LLMOrchestrator
+    from maicrosoft.registry.registry import PrimitiveRegistry
+    from maicrosoft.validation.validator import PlanValidator
 
 app = typer.Typer(
     name="maicrosoft",
@@ -23,12 +28,230 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+_console: Console | None = None
+
+
+def console() -> Console:
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+# Parsed and validated plans, keyed by plan file, primitives and validator source
+PLAN_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "maicrosoft" / "plans"
+)
+# Least recently used entries beyond this many are deleted when a new one is written
+PLAN_CACHE_MAX_ENTRIES = 64
+
+# Packages whose source decides how a plan parses and validates
+_VALIDATION_PACKAGES = ("core", "registry", "validation")
+
+# Above this many rows listings are printed as plain tab-separated text
+PLAIN_OUTPUT_THRESHOLD = 500
+
+
+# Column specs (header, add_column kwargs) for the listing tables
+_ColumnSpecs = tuple[tuple[str, dict[str, Any]], ...]
+ID_COLUMN: tuple[str, dict[str, Any]] = ("ID", {"style": "cyan", "no_wrap": True})
+PARTICLE_COLUMNS: _ColumnSpecs = (ID_COLUMN, ("Name", {}), ("Category", {}), ("Description", {}))
+SEARCH_COLUMNS: _ColumnSpecs = (ID_COLUMN, ("Name", {}), ("Description", {}))
+SUGGEST_COLUMNS: _ColumnSpecs = (
+    ID_COLUMN,
+    ("Name", {}),
+    ("Score", {"justify": "right"}),
+    ("Description", {}),
+)
+
+
+def _listing_table(title: str, columns: _ColumnSpecs, rows: Sequence[tuple[str, ...]]) -> None:
+    """Print rows as a Rich table with the given column specs."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    for row in rows:
+        table.add_row(*_text_cells(*row))
+    console().print(table)
+
+
+def _truncate(text: str, width: int = 50) -> str:
+    """Shorten text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _text_cells(*values: str) -> list[Text]:
+    """Wrap cell values in Text so Rich does not scan each one for markup."""
+    from rich.text import Text
+
+    return [Text(value) for value in values]
+
+
+def _print_plain_rows(rows: Sequence[tuple[str, ...]]) -> None:
+    """Print rows as tab-separated text, skipping Rich layout and markup."""
+    console().print(
+        "\n".join("\t".join(row) for row in rows), highlight=False, markup=False
+    )
+
+
+@lru_cache(maxsize=4)
+def get_orchestrator(model: str = "claude-sonnet-4-20250514") -> LLMOrchestrator:
+    """Get an LLMOrchestrator for model, sharing the cached registry."""
+    from maicrosoft.llm import LLMOrchestrator
+
+    return LLMOrchestrator(registry=get_registry(), model=model)
+
 
+def load_plan_data(plan_file: Path) -> dict[str, Any]:
+    """Parse a plan file with libyaml when available."""
+    import yaml
 
-def get_registry() -> PrimitiveRegistry:
-    """Get the primitive registry."""
-    return PrimitiveRegistry()
+    from maicrosoft.registry.loader import YAML_LOADER
+
+    return cast("dict[str, Any]", yaml.load(plan_file.read_bytes(), Loader=YAML_LOADER))
+
+
+@lru_cache(maxsize=1)
+def _validation_source_digest() -> bytes:
+    """Hash of the model, registry and validator source, so code edits miss the cache."""
+    import hashlib
+
+    package_dir = Path(__file__).parent
+    h = hashlib.blake2b(digest_size=16)
+    for package in _VALIDATION_PACKAGES:
+        for path in sorted((package_dir / package).rglob("*.py")):
+            h.update(path.relative_to(package_dir).as_posix().encode())
+            h.update(path.read_bytes())
+    return h.digest()
+
+
+def _plan_cache_key(plan_file: Path, primitives_dir: Path) -> str:
+    """Fingerprint a plan file together with every primitive definition."""
+    import hashlib
+
+    from maicrosoft import __version__
+
+    h = hashlib.blake2b(__version__.encode(), digest_size=16)
+    h.update(_validation_source_digest())
+    for path in [plan_file.resolve(), *sorted(primitives_dir.rglob("*.yaml"))]:
+        st = path.stat()
+        h.update(f"{path}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def _prune_plan_cache() -> None:
+    """Delete the least recently used cache entries beyond PLAN_CACHE_MAX_ENTRIES."""
+    entries = []
+    for entry in os.scandir(PLAN_CACHE_DIR):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry.path))
+        except OSError:
+            pass
+    entries.sort(reverse=True)
+    for _, path in entries[PLAN_CACHE_MAX_ENTRIES:]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def load_and_validate(plan_file: Path) -> tuple[Plan, ValidationResult]:
+    """Parse and validate a plan, memoized on disk across CLI invocations.
+
+    The cache key covers the plan file, every primitive YAML and the source
+    of the models and validator, so editing any of them invalidates it;
+    `validate` followed by `compile` parses once.
+
+    Raises yaml.YAMLError or pydantic.ValidationError (see _plan_errors) when
+    the file is not a valid plan.
+    """
+    import pickle
+
+    from maicrosoft.core.models import Plan
+
+    registry = get_registry()
+    key = _plan_cache_key(plan_file, registry.loader.primitives_dir)
+    cache_path = PLAN_CACHE_DIR / f"{key}.pkl"
+
+    try:
+        cached = pickle.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception:
+        cache_path.unlink(missing_ok=True)
+    else:
+        # Mark the entry as recently used for _prune_plan_cache
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return cast("tuple[Plan, ValidationResult]", cached)
+
+    plan = Plan.model_validate(load_plan_data(plan_file))
+    result = get_validator().validate(plan)
+
+    try:
+        PLAN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps((plan, result), protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(cache_path)
+        _prune_plan_cache()
+    except OSError:
+        pass
+
+    return plan, result
+
+
+def _plan_errors() -> tuple[type[Exception], ...]:
+    """Exceptions load_and_validate raises for a malformed plan file."""
+    import yaml
+    from pydantic import ValidationError
+
+    return (yaml.YAMLError, ValidationError)
+
+
+def write_json(data: dict[str, Any], path: Path) -> None:
+    """Write data as 2-space indented JSON, via orjson when installed.
+
+    The document is serialised in memory and written with a single call;
+    json.dump would issue one small write per token.
+    """
+    from maicrosoft._compat import orjson
+
+    if orjson is not None:
+        try:
+            path.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+            return
+        except TypeError:
+            # e.g. integers beyond 64 bits, which json handles
+            pass
+
+    import json
+
+    path.write_text(json.dumps(data, indent=2))
+
+
+@cache
+def get_registry(primitives_dir: str | None = None) -> PrimitiveRegistry:
+    """Get the primitive registry, built once per directory per process."""
+    from maicrosoft.registry.registry import PrimitiveRegistry
+
+    return PrimitiveRegistry(primitives_dir)
+
+
+@lru_cache(maxsize=1)
+def get_validator() -> PlanValidator:
+    """Get the plan validator, built once over the cached registry."""
+    from maicrosoft.validation.validator import PlanValidator
+
+    return PlanValidator(get_registry())
 
 
 @app.command()
@@ -37,10 +260,14 @@ def init(
     path: Optional[Path] = typer.Option(None, help="Project path"),
 ) -> None:
     """Initialize a new Maicrosoft project."""
+    import yaml
+
+    from maicrosoft.registry.loader import YAML_DUMPER
+
     project_path = path or Path.cwd() / name
 
     if project_path.exists():
-        console.print(f"[red]Error:[/red] Directory already exists: {project_path}")
+        console().print(f"[red]Error:[/red] Directory already exists: {project_path}")
         raise typer.Exit(1)
 
     project_path.mkdir(parents=True)
@@ -59,14 +286,15 @@ def init(
         },
     }
 
-    with open(project_path / "maicrosoft.yaml", "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+    (project_path / "maicrosoft.yaml").write_text(
+        yaml.dump(config, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+    )
 
-    console.print(f"[green]Created project:[/green] {project_path}")
-    console.print("\nNext steps:")
-    console.print(f"  cd {name}")
-    console.print("  maicrosoft particles list")
-    console.print('  maicrosoft compose "your workflow description"')
+    console().print(f"[green]Created project:[/green] {project_path}")
+    console().print("\nNext steps:")
+    console().print(f"  cd {name}")
+    console().print("  maicrosoft particles list")
+    console().print('  maicrosoft compose "your workflow description"')
 
 
 @app.command()
@@ -74,26 +302,23 @@ def validate(
     plan_file: Path = typer.Argument(..., help="Path to plan YAML file"),
 ) -> None:
     """Validate a plan against the primitives registry."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     if not plan_file.exists():
-        console.print(f"[red]Error:[/red] File not found: {plan_file}")
+        console().print(f"[red]Error:[/red] File not found: {plan_file}")
         raise typer.Exit(1)
 
-    with open(plan_file) as f:
-        plan_data = yaml.safe_load(f)
-
     try:
-        plan = Plan(**plan_data)
-    except Exception as e:
-        console.print(f"[red]Error parsing plan:[/red] {e}")
+        plan, result = load_and_validate(plan_file)
+    except _plan_errors() as e:
+        console().print(f"[red]Error parsing plan:[/red] {e}")
         raise typer.Exit(1)
 
-    validator = PlanValidator()
-    result = validator.validate(plan)
-
     if result.valid:
-        console.print(Panel("[green]Plan is valid[/green]", title="Validation Result"))
+        console().print(Panel("[green]Plan is valid[/green]", title="Validation Result"))
     else:
-        console.print(Panel("[red]Plan has errors[/red]", title="Validation Result"))
+        console().print(Panel("[red]Plan has errors[/red]", title="Validation Result"))
 
     if result.violations:
         table = Table(title="Violations")
@@ -105,7 +330,7 @@ def validate(
         for v in result.violations:
             table.add_row(v.level, v.code, v.message, v.node_id or "-")
 
-        console.print(table)
+        console().print(table)
 
     if result.warnings:
         table = Table(title="Warnings")
@@ -116,7 +341,7 @@ def validate(
         for w in result.warnings:
             table.add_row(w.level, w.code, w.message)
 
-        console.print(table)
+        console().print(table)
 
     if not result.valid:
         raise typer.Exit(1)
@@ -126,27 +351,31 @@ def validate(
 def list_particles(
     category: Optional[str] = typer.Option(None, "--category", "-c", help="Filter by category"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show details"),
+    limit: int = typer.Option(200, "--limit", "-n", min=1, help="Maximum particles to show"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Number of particles to skip"),
 ) -> None:
     """List available particles."""
     registry = get_registry()
     particles = registry.list(primitive_type="particle", category=category)
 
-    table = Table(title="Available Particles")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name")
-    table.add_column("Category")
-    table.add_column("Description")
-
-    for p in particles:
-        table.add_row(
-            p["id"],
-            p["name"],
-            p.get("category", "-"),
-            p.get("description", "-")[:50] + "..." if len(p.get("description", "")) > 50 else p.get("description", "-"),
-        )
+    page = particles[offset:offset + limit]
+    rows = [
+        (p["id"], p["name"], p.get("category", "-"), _truncate(p.get("description", "-")))
+        for p in page
+    ]
+
+    if len(rows) > PLAIN_OUTPUT_THRESHOLD:
+        _print_plain_rows(rows)
+    else:
+        _listing_table("Available Particles", PARTICLE_COLUMNS, rows)
 
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(particles)} particles[/dim]")
+    if page and len(page) < len(particles):
+        console().print(
+            f"\n[dim]Showing {offset + 1}-{offset + len(page)} "
+            f"of {len(particles)} particles, use --offset to page[/dim]"
+        )
+    else:
+        console().print(f"\n[dim]Total: {len(particles)} particles[/dim]")
 
 
 @app.command("particle")
@@ -154,15 +383,18 @@ def show_particle(
     primitive_id: str = typer.Argument(..., help="Particle ID (e.g., P001)"),
 ) -> None:
     """Show details of a specific particle."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     registry = get_registry()
 
     try:
         primitive = registry.get(primitive_id)
     except FileNotFoundError:
-        console.print(f"[red]Error:[/red] Particle not found: {primitive_id}")
+        console().print(f"[red]Error:[/red] Particle not found: {primitive_id}")
         raise typer.Exit(1)
 
-    console.print(Panel(
+    console().print(Panel(
         f"[bold]{primitive.metadata.name}[/bold]\n\n{primitive.metadata.description}",
         title=f"Particle {primitive_id}",
     ))
@@ -175,14 +407,14 @@ def show_particle(
         table.add_column("Description")
 
         for inp in primitive.interface.inputs:
-            table.add_row(
+            table.add_row(*_text_cells(
                 inp.name,
                 inp.type.value,
                 "Yes" if inp.required else "No",
                 inp.description or "-",
-            )
+            ))
 
-        console.print(table)
+        console().print(table)
 
     if primitive.interface.outputs:
         table = Table(title="Outputs")
@@ -191,9 +423,9 @@ def show_particle(
         table.add_column("Description")
 
         for out in primitive.interface.outputs:
-            table.add_row(out.name, out.type.value, out.description or "-")
+            table.add_row(*_text_cells(out.name, out.type.value, out.description or "-"))
 
-        console.print(table)
+        console().print(table)
 
 
 @app.command()
@@ -205,18 +437,16 @@ def search(
     results = registry.search_by_name(query)
 
     if not results:
-        console.print(f"[yellow]No particles found matching:[/yellow] {query}")
+        console().print(f"[yellow]No particles found matching:[/yellow] {query}")
         return
 
-    table = Table(title=f"Search Results for '{query}'")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name")
-    table.add_column("Description")
+    rows = [(r["id"], r["name"], _truncate(r.get("description", "-"), 60)) for r in results]
 
-    for r in results:
-        table.add_row(r["id"], r["name"], r.get("description", "-")[:60])
+    if len(rows) > PLAIN_OUTPUT_THRESHOLD:
+        _print_plain_rows(rows)
+        return
 
-    console.print(table)
+    _listing_table(f"Search Results for '{query}'", SEARCH_COLUMNS, rows)
 
 
 @app.command()
@@ -227,48 +457,43 @@ def compile(
 ) -> None:
     """Compile a plan to a target format (n8n, python, temporal)."""
     if not plan_file.exists():
-        console.print(f"[red]Error:[/red] File not found: {plan_file}")
+        console().print(f"[red]Error:[/red] File not found: {plan_file}")
         raise typer.Exit(1)
 
-    with open(plan_file) as f:
-        plan_data = yaml.safe_load(f)
-
     try:
-        plan = Plan(**plan_data)
-    except Exception as e:
-        console.print(f"[red]Error parsing plan:[/red] {e}")
+        plan, result = load_and_validate(plan_file)
+    except _plan_errors() as e:
+        console().print(f"[red]Error parsing plan:[/red] {e}")
         raise typer.Exit(1)
 
-    validator = PlanValidator()
-    result = validator.validate(plan)
-
     if not result.valid:
-        console.print("[red]Error:[/red] Plan validation failed. Run 'maicrosoft validate' for details.")
+        console().print(
+            "[red]Error:[/red] Plan validation failed. Run 'maicrosoft validate' for details."
+        )
         raise typer.Exit(1)
 
     # Compile to target
-    import json
-
     if target == "n8n":
+        from maicrosoft.compiler.n8n import N8NCompiler
+
         registry = get_registry()
         compiler = N8NCompiler(registry)
         workflow = compiler.compile(plan)
 
         output_path = output or plan_file.with_suffix(".n8n.json")
-        with open(output_path, "w") as f:
-            json.dump(workflow, f, indent=2)
+        write_json(workflow, output_path)
 
-        console.print(f"[green]Compiled to:[/green] {output_path}")
+        console().print(f"[green]Compiled to:[/green] {output_path}")
     else:
-        console.print(f"[yellow]Note:[/yellow] Compilation to '{target}' not yet implemented.")
-        console.print("Supported targets: n8n")
+        console().print(f"[yellow]Note:[/yellow] Compilation to '{target}' not yet implemented.")
+        console().print("Supported targets: n8n")
 
 
 @app.command()
 def gaps() -> None:
     """Show primitives that have been requested but don't exist."""
-    console.print("[yellow]Note:[/yellow] Gap tracking not yet implemented.")
-    console.print("This feature will track missing primitives from failed validations.")
+    console().print("[yellow]Note:[/yellow] Gap tracking not yet implemented.")
+    console().print("This feature will track missing primitives from failed validations.")
 
 
 @app.command()
@@ -282,17 +507,23 @@ def serve(
     try:
         from maicrosoft.mcp import create_server
     except ImportError:
-        console.print("[red]Error:[/red] MCP dependencies not installed.")
-        console.print("Install with: pip install maicrosoft[mcp]")
+        console().print("[red]Error:[/red] MCP dependencies not installed.")
+        console().print("Install with: pip install maicrosoft[mcp]")
         raise typer.Exit(1)
 
-    console.print(f"[green]Starting MCP server...[/green]")
-    console.print(f"  Primitives: {primitives}")
-    console.print(f"  Port: {port}")
-    console.print("\n[dim]Press Ctrl+C to stop[/dim]\n")
+    console().print(f"[green]Starting MCP server...[/green]")
+    console().print(f"  Primitives: {primitives}")
+    console().print(f"  Port: {port}")
+    console().print("\n[dim]Press Ctrl+C to stop[/dim]\n")
+
+    server = create_server(str(primitives), registry=get_registry(str(primitives)))
 
-    server = create_server(str(primitives))
-    asyncio.run(server.run())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(server.run())
+    else:
+        uvloop.run(server.run())
 
 
 @app.command()
@@ -302,46 +533,45 @@ def compose(
     model: str = typer.Option("claude-sonnet-4-20250514", "--model", "-m", help="LLM model to use"),
 ) -> None:
     """Compose a plan from natural language description using AI."""
-    from maicrosoft.llm import LLMOrchestrator
+    from rich.panel import Panel
 
-    console.print(f"[cyan]Composing plan for:[/cyan] {description}\n")
+    console().print(f"[cyan]Composing plan for:[/cyan] {description}\n")
 
-    orchestrator = LLMOrchestrator(model=model)
+    orchestrator = get_orchestrator(model)
 
-    with console.status("[bold green]Generating plan..."):
+    with console().status("[bold green]Generating plan..."):
         result = orchestrator.compose_sync(description)
 
     if result.success and result.plan:
-        console.print(Panel("[green]Plan composed successfully[/green]", title="Result"))
+        console().print(Panel("[green]Plan composed successfully[/green]", title="Result"))
 
         if result.gaps:
-            console.print("\n[yellow]Detected gaps (missing primitives):[/yellow]")
+            console().print("\n[yellow]Detected gaps (missing primitives):[/yellow]")
             for gap in result.gaps:
-                console.print(f"  - {gap}")
+                console().print(f"  - {gap}")
 
         # Save plan
         if result.plan_yaml:
             output_path = output or Path(f"plan-{result.plan.metadata.id}.yaml")
-            with open(output_path, "w") as f:
-                f.write(result.plan_yaml)
-            console.print(f"\n[green]Plan saved to:[/green] {output_path}")
+            output_path.write_text(result.plan_yaml)
+            console().print(f"\n[green]Plan saved to:[/green] {output_path}")
 
         # Show plan summary
-        console.print(f"\n[bold]Plan:[/bold] {result.plan.metadata.name}")
-        console.print(f"[dim]Nodes: {len(result.plan.nodes)}[/dim]")
+        console().print(f"\n[bold]Plan:[/bold] {result.plan.metadata.name}")
+        console().print(f"[dim]Nodes: {len(result.plan.nodes)}[/dim]")
 
     else:
-        console.print(Panel("[red]Plan composition failed[/red]", title="Result"))
+        console().print(Panel("[red]Plan composition failed[/red]", title="Result"))
 
         if result.validation_errors:
-            console.print("\n[red]Validation errors:[/red]")
+            console().print("\n[red]Validation errors:[/red]")
             for error in result.validation_errors:
-                console.print(f"  - {error}")
+                console().print(f"  - {error}")
 
         if result.suggestions:
-            console.print("\n[yellow]Suggestions:[/yellow]")
+            console().print("\n[yellow]Suggestions:[/yellow]")
             for suggestion in result.suggestions:
-                console.print(f"  - {suggestion}")
+                console().print(f"  - {suggestion}")
 
         raise typer.Exit(1)
 
@@ -351,40 +581,23 @@ def suggest(
     description: str = typer.Argument(..., help="Description of what you want to do"),
 ) -> None:
     """Suggest primitives for a given task description."""
-    from maicrosoft.llm import LLMOrchestrator
-
-    orchestrator = LLMOrchestrator()
+    orchestrator = get_orchestrator()
     results = orchestrator.suggest_primitives(description)
 
     if not results:
-        console.print(f"[yellow]No primitives found for:[/yellow] {description}")
+        console().print(f"[yellow]No primitives found for:[/yellow] {description}")
         return
 
-    table = Table(title=f"Suggested Primitives for '{description}'")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name")
-    table.add_column("Score", justify="right")
-    table.add_column("Description")
-
-    for r in results:
-        table.add_row(
-            r["id"],
-            r["name"],
-            str(r["score"]),
-            r["description"][:50] + "..." if len(r["description"]) > 50 else r["description"],
-        )
-
-    console.print(table)
+    rows = [(r["id"], r["name"], str(r["score"]), _truncate(r["description"])) for r in results]
+    _listing_table(f"Suggested Primitives for '{description}'", SUGGEST_COLUMNS, rows)
 
 
 @app.command()
 def version() -> None:
     """Show version information."""
-    from maicrosoft import __version__
+    from maicrosoft.__main__ import print_version
 
-    console.print(f"Maicrosoft v{__version__}")
-    console.print("Framework for Hallucination-Free AI Coding")
-    console.print("Created by The Collective BORG.tools")
+    print_version()
 
 
 def main() -> None:
@@ -1,6 +1,26 @@
 """Compiler module for generating target-specific outputs."""
 
-from maicrosoft.compiler.n8n import N8NCompiler
-from maicrosoft.compiler.metaplan import MetaPlanCompiler, compile_meta_plan
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from maicrosoft.compiler.n8n import N8NCompiler
+    from maicrosoft.compiler.metaplan import MetaPlanCompiler, compile_meta_plan
 
 __all__ = ["N8NCompiler", "MetaPlanCompiler", "compile_meta_plan"]
+
+# Resolved on first access so using one compiler does not import the others
+_LAZY_IMPORTS = {
+    "N8NCompiler": "maicrosoft.compiler.n8n",
+    "MetaPlanCompiler": "maicrosoft.compiler.metaplan",
+    "compile_meta_plan": "maicrosoft.compiler.metaplan",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
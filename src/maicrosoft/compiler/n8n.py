@@ -6,9 +6,13 @@ Compiles Maicrosoft Plan JSON into N8N workflow JSON format.
 from __future__ import annotations
 
 import json
+import os
+import re
 import uuid
-from typing import Any
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any
 
+from maicrosoft._compat import orjson
 from maicrosoft.core.models import (
     CodeBlock,
     Plan,
@@ -18,10 +22,158 @@ from maicrosoft.core.models import (
 )
 from maicrosoft.registry.registry import PrimitiveRegistry
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# {{ ref: node.output }} references in node inputs; the marker is checked first
+_HAS_REF = "{{ ref:"
+_REF_RE = re.compile(r"\{\{\s*ref:\s*([^}]+)\s*\}\}")
+
+# JavaScript bodies of generated code nodes, filled with str.format_map
+_TRANSFORM_TEMPLATES: dict[str, str] = {
+    "map": """// Transform: Map operation
+const items = {source};
+const results = items.map(item => {{
+  return {template};
+}});
+return results.map(json => ({{json}}));""",
+    "filter": """// Transform: Filter operation
+const items = {source};
+const results = items.filter(item => {{
+  return {condition};
+}});
+return results.map(json => ({{json}}));""",
+    "reduce": """// Transform: Reduce operation
+const items = {source};
+const result = items.reduce((acc, item) => {{
+  {template}
+}}, {initial});
+return [{{json: result}}];""",
+    "flatten": """// Transform: Flatten operation
+const items = {source};
+const results = items.flat();
+return results.map(json => ({{json}}));""",
+}
+_TRANSFORM_DEFAULT = """// Transform: {operation}
+const items = {source};
+return items.map(json => ({{json}}));"""
+# Body used by map and reduce when the node gives no template
+_TRANSFORM_EMPTY_TEMPLATE = {"map": "item", "reduce": "return acc;"}
+
+_LOG_TEMPLATE = """// Log: {level}
+console.log('{level}: {message}');
+console.log('Data:', {data});
+
+// Pass through input data
+return $input.all();"""
+
+_GENERIC_TEMPLATE = """// Generic node for primitive: {primitive_id}
+// Inputs: {inputs}
+return $input.all();"""
+
+_JS_FALLBACK_TEMPLATE = """// Maicrosoft Fallback Code: {description}
+// Inputs: {inputs}
+// Outputs: {outputs}
+
+{code}"""
+
+_PY_FALLBACK_TEMPLATE = """// Maicrosoft Fallback: Python code (requires external execution)
+// Description: {description}
+// WARNING: Python fallback not directly executable in N8N
+
+const pythonCode = `{code}`;
+// TODO: Send to Python execution service
+return $input.all();"""
+
+# Inputs and schemas are most often empty; skip json.dumps for those
+_EMPTY_JSON = "{}"
+
+
+def _dumps_js(value: Any) -> str:
+    """JSON text of a value for embedding in generated JavaScript."""
+    if value == {}:
+        return _EMPTY_JSON
+    return json.dumps(value)
+
+
+def _dumps(obj: Any, indent: int | None = 2) -> str:
+    """Serialize a workflow, via orjson when installed and the indent is 2."""
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which json handles
+            pass
+    return json.dumps(obj, indent=indent)
+
+
+# Trigger node builders: config -> (node type, type version, fresh parameters)
+def _build_webhook_trigger(config: dict[str, Any]) -> tuple[str, int, dict[str, Any]]:
+    return (
+        "n8n-nodes-base.webhook",
+        2,
+        {
+            "httpMethod": "POST",
+            "path": config.get("path", "webhook"),
+            "responseMode": "responseNode",
+        },
+    )
+
+
+def _build_schedule_trigger(config: dict[str, Any]) -> tuple[str, int, dict[str, Any]]:
+    if "cron" in config:
+        rule = {"cron": config["cron"]}
+    else:
+        rule = {"interval": [{"field": "hours", "hoursInterval": 1}]}
+    return ("n8n-nodes-base.scheduleTrigger", 1, {"rule": rule})
+
+
+def _build_manual_trigger(config: dict[str, Any]) -> tuple[str, int, dict[str, Any]]:
+    return ("n8n-nodes-base.manualTrigger", 1, {})
+
+
+def _build_event_trigger(config: dict[str, Any]) -> tuple[str, int, dict[str, Any]]:
+    return ("n8n-nodes-base.webhook", 2, {"httpMethod": "POST", "path": "event"})
+
+
+_TRIGGER_BUILDERS: dict[str, Callable[[dict[str, Any]], tuple[str, int, dict[str, Any]]]] = {
+    "webhook": _build_webhook_trigger,
+    "schedule": _build_schedule_trigger,
+    "manual": _build_manual_trigger,
+    "event": _build_event_trigger,
+}
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str) -> str:
+    """Sanitize node name for N8N."""
+    # Replace underscores with spaces and title case
+    return name.replace("_", " ").title()
+
+
+class _IdPool:
+    """Random (version 4) UUID strings cut from one os.urandom call per batch."""
+
+    def __init__(self, batch: int = 256):
+        self._batch = batch
+        self._buf = os.urandom(16 * batch)
+        self._i = 0
+
+    def next_uuid(self) -> str:
+        """Return the next unused id, refilling the pool when it runs out."""
+        if self._i >= len(self._buf):
+            self._buf = os.urandom(16 * self._batch)
+            self._i = 0
+        raw = self._buf[self._i : self._i + 16]
+        self._i += 16
+        return str(uuid.UUID(bytes=raw, version=4))
+
 
 class N8NNode:
     """Represents an N8N workflow node."""
 
+    __slots__ = ("id", "name", "type", "position", "parameters", "type_version")
+
     def __init__(
         self,
         name: str,
@@ -29,8 +181,9 @@ class N8NNode:
         position: tuple[int, int],
         parameters: dict[str, Any] | None = None,
         type_version: int = 1,
+        id_pool: _IdPool | None = None,
     ):
-        self.id = str(uuid.uuid4())
+        self.id = id_pool.next_uuid() if id_pool is not None else str(uuid.uuid4())
         self.name = name
         self.type = node_type
         self.position = list(position)
@@ -52,6 +205,8 @@ class N8NNode:
 class N8NConnection:
     """Represents a connection between N8N nodes."""
 
+    __slots__ = ("source_node", "target_node", "source_index", "target_index")
+
     def __init__(
         self,
         source_node: str,
@@ -146,39 +301,6 @@ class N8NCompiler:
         },
     }
 
-    # Trigger type to N8N trigger node
-    TRIGGER_TO_N8N: dict[str, dict[str, Any]] = {
-        "webhook": {
-            "type": "n8n-nodes-base.webhook",
-            "version": 2,
-            "parameters": {
-                "httpMethod": "POST",
-                "path": "webhook",
-                "responseMode": "responseNode",
-            },
-        },
-        "schedule": {
-            "type": "n8n-nodes-base.scheduleTrigger",
-            "version": 1,
-            "parameters": {
-                "rule": {"interval": [{"field": "hours", "hoursInterval": 1}]}
-            },
-        },
-        "manual": {
-            "type": "n8n-nodes-base.manualTrigger",
-            "version": 1,
-            "parameters": {},
-        },
-        "event": {
-            "type": "n8n-nodes-base.webhook",
-            "version": 2,
-            "parameters": {
-                "httpMethod": "POST",
-                "path": "event",
-            },
-        },
-    }
-
     def __init__(self, registry: PrimitiveRegistry | None = None):
         """Initialize compiler.
 
@@ -186,6 +308,19 @@ class N8NCompiler:
             registry: Primitive registry for looking up definitions
         """
         self.registry = registry or PrimitiveRegistry()
+        # Id source for the compile in progress; nodes built outside compile() use uuid4
+        self._id_pool: _IdPool | None = None
+
+        # Primitive id -> handler taking just the node, resolved once per compiler
+        self._dispatch: dict[str, Callable[[PlanNode], N8NNode]] = {
+            primitive_id: partial(
+                getattr(self, n8n_def["custom_handler"])
+                if "custom_handler" in n8n_def
+                else self._compile_standard,
+                n8n_def=n8n_def,
+            )
+            for primitive_id, n8n_def in self.PARTICLE_TO_N8N.items()
+        }
 
     def compile(self, plan: Plan) -> dict[str, Any]:
         """Compile a plan to N8N workflow JSON.
@@ -196,7 +331,17 @@ class N8NCompiler:
         Returns:
             N8N workflow JSON dict
         """
-        nodes: list[N8NNode] = []
+        # One id per node, plus the trigger and the workflow version
+        id_pool = self._id_pool = _IdPool(len(plan.nodes) + 2)
+        try:
+            return self._compile_workflow(plan, id_pool)
+        finally:
+            self._id_pool = None
+
+    def _compile_workflow(self, plan: Plan, id_pool: _IdPool) -> dict[str, Any]:
+        """Build the workflow dict for compile(), drawing ids from its id_pool."""
+        # Node dicts in output order: trigger first, then plan nodes
+        nodes: list[dict[str, Any] | None] = [None] * (len(plan.nodes) + 1)
         connections: dict[str, dict[str, list[list[dict[str, Any]]]]] = {}
         node_id_map: dict[str, str] = {}  # plan node id -> n8n node name
 
@@ -209,15 +354,16 @@ class N8NCompiler:
         # Add trigger node
         trigger_node = self._compile_trigger(plan)
         trigger_node.position = [x_pos, y_pos]
-        nodes.append(trigger_node)
+        nodes[0] = trigger_node.to_dict()
         node_id_map["__trigger__"] = trigger_node.name
 
         # Compile each plan node
+        compile_node = self._compile_node
         for i, plan_node in enumerate(plan.nodes):
             x_pos += x_step
-            n8n_node = self._compile_node(plan_node, plan)
+            n8n_node = compile_node(plan_node, plan)
             n8n_node.position = [x_pos, y_pos + (i % 3) * y_step]
-            nodes.append(n8n_node)
+            nodes[i + 1] = n8n_node.to_dict()
             node_id_map[plan_node.id] = n8n_node.name
 
         # Build connections
@@ -226,13 +372,13 @@ class N8NCompiler:
         # Build workflow
         workflow = {
             "name": plan.metadata.name,
-            "nodes": [node.to_dict() for node in nodes],
+            "nodes": nodes,
             "connections": connections,
             "active": False,
             "settings": {
                 "executionOrder": "v1",
             },
-            "versionId": str(uuid.uuid4()),
+            "versionId": id_pool.next_uuid(),
             "meta": {
                 "maicrosoft_plan_id": plan.metadata.id,
                 "maicrosoft_version": plan.metadata.version,
@@ -251,23 +397,16 @@ class N8NCompiler:
             trigger_type = plan.trigger.type.value
             config = plan.trigger.config
 
-        trigger_def = self.TRIGGER_TO_N8N.get(
-            trigger_type, self.TRIGGER_TO_N8N["manual"]
-        )
-
-        # Merge config with default parameters
-        parameters = dict(trigger_def["parameters"])
-        if trigger_type == "schedule" and "cron" in config:
-            parameters["rule"] = {"cron": config["cron"]}
-        elif trigger_type == "webhook" and "path" in config:
-            parameters["path"] = config["path"]
+        builder = _TRIGGER_BUILDERS.get(trigger_type, _build_manual_trigger)
+        node_type, version, parameters = builder(config)
 
         return N8NNode(
             name="Trigger",
-            node_type=trigger_def["type"],
+            node_type=node_type,
             position=(0, 0),
             parameters=parameters,
-            type_version=trigger_def.get("version", 1),
+            type_version=version,
+            id_pool=self._id_pool,
         )
 
     def _compile_node(self, node: PlanNode, plan: Plan) -> N8NNode:
@@ -278,28 +417,25 @@ class N8NCompiler:
         if node.primitive_id is None:
             raise ValueError(f"Node {node.id} has no primitive_id or fallback")
 
-        # Get primitive definition
-        primitive_id = node.primitive_id
-        n8n_def = self.PARTICLE_TO_N8N.get(primitive_id)
+        handler = self._dispatch.get(node.primitive_id)
 
-        if n8n_def is None:
+        if handler is None:
             # Try to compile as generic code node
             return self._compile_generic(node)
 
-        # Check for custom handler
-        if "custom_handler" in n8n_def:
-            handler = getattr(self, n8n_def["custom_handler"])
-            return handler(node, n8n_def)
+        return handler(node)
 
-        # Standard parameter mapping
+    def _compile_standard(self, node: PlanNode, n8n_def: dict[str, Any]) -> N8NNode:
+        """Compile a particle through its param_map."""
         parameters = self._map_parameters(node.inputs, n8n_def.get("param_map", {}))
 
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type=n8n_def["type"],
             position=(0, 0),
             parameters=parameters,
             type_version=n8n_def.get("version", 1),
+            id_pool=self._id_pool,
         )
 
     def _compile_fallback(self, node: PlanNode) -> N8NNode:
@@ -310,7 +446,7 @@ class N8NCompiler:
         code = self._wrap_fallback_code(node.fallback)
 
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type="n8n-nodes-base.code",
             position=(0, 0),
             parameters={
@@ -318,29 +454,25 @@ class N8NCompiler:
                 "jsCode": code,
             },
             type_version=2,
+            id_pool=self._id_pool,
         )
 
     def _wrap_fallback_code(self, fallback: CodeBlock) -> str:
         """Wrap fallback code for N8N execution."""
         if fallback.language == "javascript":
-            return f"""
-// Maicrosoft Fallback Code: {fallback.description}
-// Inputs: {json.dumps(fallback.inputs_schema)}
-// Outputs: {json.dumps(fallback.outputs_schema)}
-
-{fallback.code}
-""".strip()
+            return _JS_FALLBACK_TEMPLATE.format_map(
+                {
+                    "description": fallback.description,
+                    "inputs": _dumps_js(fallback.inputs_schema),
+                    "outputs": _dumps_js(fallback.outputs_schema),
+                    "code": fallback.code,
+                }
+            ).rstrip()
         elif fallback.language == "python":
             # N8N doesn't natively support Python, wrap in code node
-            return f"""
-// Maicrosoft Fallback: Python code (requires external execution)
-// Description: {fallback.description}
-// WARNING: Python fallback not directly executable in N8N
-
-const pythonCode = `{fallback.code}`;
-// TODO: Send to Python execution service
-return $input.all();
-""".strip()
+            return _PY_FALLBACK_TEMPLATE.format_map(
+                {"description": fallback.description, "code": fallback.code}
+            )
         else:
             return fallback.code
 
@@ -356,56 +488,26 @@ return $input.all();
         # Resolve references
         source = self._resolve_reference(source)
 
-        if operation == "map":
-            code = f"""
-// Transform: Map operation
-const items = {source};
-const results = items.map(item => {{
-  return {template or "item"};
-}});
-return results.map(json => ({{json}}));
-"""
-        elif operation == "filter":
-            code = f"""
-// Transform: Filter operation
-const items = {source};
-const results = items.filter(item => {{
-  return {condition};
-}});
-return results.map(json => ({{json}}));
-"""
-        elif operation == "reduce":
-            code = f"""
-// Transform: Reduce operation
-const items = {source};
-const result = items.reduce((acc, item) => {{
-  {template or "return acc;"}
-}}, {node.inputs.get("initial", "{}")});
-return [{{json: result}}];
-"""
-        elif operation == "flatten":
-            code = f"""
-// Transform: Flatten operation
-const items = {source};
-const results = items.flat();
-return results.map(json => ({{json}}));
-"""
-        else:
-            code = f"""
-// Transform: {operation}
-const items = {source};
-return items.map(json => ({{json}}));
-"""
+        code = _TRANSFORM_TEMPLATES.get(operation, _TRANSFORM_DEFAULT).format_map(
+            {
+                "operation": operation,
+                "source": source,
+                "template": template or _TRANSFORM_EMPTY_TEMPLATE.get(operation, ""),
+                "condition": condition,
+                "initial": node.inputs.get("initial", "{}"),
+            }
+        )
 
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type="n8n-nodes-base.code",
             position=(0, 0),
             parameters={
                 "mode": "runOnceForAllItems",
-                "jsCode": code.strip(),
+                "jsCode": code,
             },
             type_version=2,
+            id_pool=self._id_pool,
         )
 
     def _compile_branch(
@@ -416,7 +518,7 @@ return items.map(json => ({{json}}));
 
         # Convert condition to N8N format
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type="n8n-nodes-base.if",
             position=(0, 0),
             parameters={
@@ -439,6 +541,7 @@ return items.map(json => ({{json}}));
                 },
             },
             type_version=2,
+            id_pool=self._id_pool,
         )
 
     def _compile_loop(
@@ -448,7 +551,7 @@ return items.map(json => ({{json}}));
         batch_size = node.inputs.get("batch_size", 1)
 
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type="n8n-nodes-base.splitInBatches",
             position=(0, 0),
             parameters={
@@ -456,6 +559,7 @@ return items.map(json => ({{json}}));
                 "options": {},
             },
             type_version=3,
+            id_pool=self._id_pool,
         )
 
     def _compile_llm_call(
@@ -469,7 +573,7 @@ return items.map(json => ({{json}}));
         max_tokens = node.inputs.get("max_tokens", 1000)
 
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type="@n8n/n8n-nodes-langchain.openAi",
             position=(0, 0),
             parameters={
@@ -494,6 +598,7 @@ return items.map(json => ({{json}}));
                 },
             },
             type_version=1,
+            id_pool=self._id_pool,
         )
 
     def _compile_log(
@@ -504,41 +609,36 @@ return items.map(json => ({{json}}));
         message = node.inputs.get("message", "")
         data = node.inputs.get("data", {})
 
-        code = f"""
-// Log: {level.upper()}
-console.log('{level.upper()}: {message}');
-console.log('Data:', {json.dumps(data)});
-
-// Pass through input data
-return $input.all();
-"""
+        code = _LOG_TEMPLATE.format_map(
+            {"level": level.upper(), "message": message, "data": _dumps_js(data)}
+        )
 
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type="n8n-nodes-base.code",
             position=(0, 0),
             parameters={
                 "mode": "runOnceForAllItems",
-                "jsCode": code.strip(),
+                "jsCode": code,
             },
             type_version=2,
+            id_pool=self._id_pool,
         )
 
     def _compile_generic(self, node: PlanNode) -> N8NNode:
         """Compile unknown primitive as generic code node."""
         return N8NNode(
-            name=self._sanitize_name(node.id),
+            name=_sanitize_name(node.id),
             node_type="n8n-nodes-base.code",
             position=(0, 0),
             parameters={
                 "mode": "runOnceForAllItems",
-                "jsCode": f"""
-// Generic node for primitive: {node.primitive_id}
-// Inputs: {json.dumps(node.inputs)}
-return $input.all();
-""".strip(),
+                "jsCode": _GENERIC_TEMPLATE.format_map(
+                    {"primitive_id": node.primitive_id, "inputs": _dumps_js(node.inputs)}
+                ),
             },
             type_version=2,
+            id_pool=self._id_pool,
         )
 
     def _map_parameters(
@@ -551,7 +651,7 @@ return $input.all();
             n8n_param = param_map.get(input_name, input_name)
 
             # Resolve references
-            if isinstance(value, str) and "{{ ref:" in value:
+            if isinstance(value, str) and _HAS_REF in value:
                 value = self._resolve_reference(value)
 
             # Handle nested parameters
@@ -573,16 +673,14 @@ return $input.all();
         if not isinstance(value, str):
             return value
 
-        if "{{ ref:" in value:
+        if _HAS_REF in value:
             # Extract reference
-            import re
-
-            match = re.search(r"\{\{\s*ref:\s*([^}]+)\s*\}\}", value)
+            match = _REF_RE.search(value)
             if match:
                 ref = match.group(1).strip()
-                parts = ref.split(".")
-                node_id = parts[0]
-                output_field = ".".join(parts[1:]) if len(parts) > 1 else "body"
+                node_id, dot, output_field = ref.partition(".")
+                if not dot:
+                    output_field = "body"
 
                 # Convert to N8N expression
                 n8n_expr = f"$('{{{{ $node[\"{node_id}\"].json.{output_field} }}}}')"
@@ -596,45 +694,35 @@ return $input.all();
         node_id_map: dict[str, str],
         trigger_name: str,
     ) -> dict[str, dict[str, list[list[dict[str, Any]]]]]:
-        """Build N8N connections from plan edges."""
-        connections: dict[str, dict[str, list[list[dict[str, Any]]]]] = {}
-
-        # Find first node (no incoming edges)
-        incoming = {edge.to_node for edge in plan.edges}
-        first_nodes = [node.id for node in plan.nodes if node.id not in incoming]
-
-        # Connect trigger to first nodes
-        if first_nodes:
-            connections[trigger_name] = {
-                "main": [
-                    [
-                        {"node": node_id_map[node_id], "type": "main", "index": 0}
-                        for node_id in first_nodes
-                    ]
-                ]
-            }
+        """Build N8N connections from plan edges in a single sweep."""
+        # Source name -> its targets; the trigger entry comes first, filled after the sweep
+        per_source: dict[str, list[dict[str, Any]]] = {trigger_name: []}
 
-        # Build connections from edges
+        incoming: set[str] = set()
+        name_of = node_id_map.get
         for edge in plan.edges:
-            source_name = node_id_map.get(edge.from_node)
-            target_name = node_id_map.get(edge.to_node)
-
+            incoming.add(edge.to_node)
+            source_name = name_of(edge.from_node)
+            target_name = name_of(edge.to_node)
             if source_name and target_name:
-                if source_name not in connections:
-                    connections[source_name] = {"main": [[]]}
-
-                connections[source_name]["main"][0].append(
-                    {"node": target_name, "type": "main", "index": 0}
-                )
-
-        return connections
-
-    def _sanitize_name(self, name: str) -> str:
-        """Sanitize node name for N8N."""
-        # Replace underscores with spaces and title case
-        return name.replace("_", " ").title()
+                targets = per_source.get(source_name)
+                if targets is None:
+                    targets = per_source[source_name] = []
+                targets.append({"node": target_name, "type": "main", "index": 0})
+
+        # Connect trigger to first nodes (no incoming edges)
+        trigger_targets = per_source[trigger_name]
+        trigger_targets[:0] = [
+            {"node": node_id_map[node.id], "type": "main", "index": 0}
+            for node in plan.nodes
+            if node.id not in incoming
+        ]
+        if not trigger_targets:
+            del per_source[trigger_name]
+
+        return {name: {"main": [targets]} for name, targets in per_source.items()}
 
     def to_json(self, plan: Plan, indent: int = 2) -> str:
         """Compile plan and return as JSON string."""
         workflow = self.compile(plan)
-        return json.dumps(workflow, indent=indent)
+        return _dumps(workflow, indent=indent)
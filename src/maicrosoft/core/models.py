@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+# Primitive ids: a level letter (particle, atom, molecule, organism) and three digits
+_PRIM_ID_RE = re.compile(r"(P|A|M|O)[0-9]{3}")
+
 
 class PrimitiveType(str, Enum):
     """Type of primitive."""
@@ -123,9 +127,7 @@ class PrimitiveMetadata(BaseModel):
     @classmethod
     def validate_id(cls, v: str) -> str:
         """Validate primitive ID format."""
-        import re
-
-        if not re.match(r"^(P|A|M|O)[0-9]{3}$", v):
+        if not _PRIM_ID_RE.fullmatch(v):
             raise ValueError(f"Invalid primitive ID: {v}")
         return v
 
@@ -213,9 +215,7 @@ class PlanNode(BaseModel):
     @classmethod
     def validate_primitive_id(cls, v: str | None) -> str | None:
         """Validate primitive ID format if provided."""
-        import re
-
-        if v is not None and not re.match(r"^(P|A|M|O)[0-9]{3}$", v):
+        if v is not None and not _PRIM_ID_RE.fullmatch(v):
             raise ValueError(f"Invalid primitive ID: {v}")
         return v
 
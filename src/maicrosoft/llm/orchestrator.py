@@ -102,6 +102,7 @@ If a required capability does NOT exist in the primitives list:
         self.validator = PlanValidator(self.registry)
         self.model = model
         self.temperature = temperature
+        self._system_prompt: str | None = None
 
     def _build_primitives_list(self) -> str:
         """Build formatted list of available primitives for the prompt."""
@@ -126,6 +127,14 @@ If a required capability does NOT exist in the primitives list:
 
         return "\n".join(lines) if lines else "No primitives available"
 
+    def _get_system_prompt(self) -> str:
+        """Format the system prompt once; the primitives list walks every primitive file."""
+        if self._system_prompt is None:
+            self._system_prompt = self.SYSTEM_PROMPT.format(
+                primitives_list=self._build_primitives_list()
+            )
+        return self._system_prompt
+
     def _extract_yaml_from_response(self, response: str) -> str:
         """Extract YAML content from LLM response."""
         # Look for YAML code block
@@ -161,10 +170,12 @@ If a required capability does NOT exist in the primitives list:
         """Parse YAML and validate the plan."""
         import yaml as yaml_lib
 
+        from maicrosoft.registry.loader import YAML_LOADER
+
         errors = []
 
         try:
-            plan_data = yaml_lib.safe_load(yaml_content)
+            plan_data = yaml_lib.load(yaml_content, Loader=YAML_LOADER)
         except Exception as e:
             return None, [f"YAML parse error: {str(e)}"]
 
@@ -197,8 +208,7 @@ If a required capability does NOT exist in the primitives list:
         Returns:
             CompositionResult with plan or errors
         """
-        primitives_list = self._build_primitives_list()
-        system_prompt = self.SYSTEM_PROMPT.format(primitives_list=primitives_list)
+        system_prompt = self._get_system_prompt()
 
         user_message = f"Create a plan for: {description}"
         if context:
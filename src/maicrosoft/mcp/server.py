@@ -30,17 +30,27 @@ from maicrosoft.validation import PlanValidator
 from maicrosoft.compiler import N8NCompiler
 from maicrosoft.core.models import Plan
 
+# Serialized responses kept per server; the oldest is dropped beyond this many
+_RESPONSE_CACHE_SIZE = 256
+
 
 class MCPServer:
     """MCP server exposing Maicrosoft primitives tools."""
 
-    def __init__(self, primitives_path: str = "primitives"):
+    def __init__(
+        self,
+        primitives_path: str = "primitives",
+        registry: PrimitiveRegistry | None = None,
+    ):
         """Initialize MCP server with registry and validator.
 
         Args:
             primitives_path: Path to primitives directory
+            registry: Existing registry to share (built from primitives_path if None)
         """
-        self.registry = PrimitiveRegistry(primitives_path)
+        self.registry = registry or PrimitiveRegistry(primitives_path)
+        # Serialized catalog responses, reused across tool calls like registry.get
+        self._response_cache: dict[tuple[str | None, ...], str] = {}
         self.validator = PlanValidator(self.registry)
         self.compiler = N8NCompiler(self.registry)
 
@@ -162,6 +172,25 @@ class MCPServer:
             else:
                 return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
+    @staticmethod
+    def _response_key(*parts: Any) -> tuple[str | None, ...] | None:
+        """Cache key for a tool call, or None when an argument is not a string."""
+        if all(part is None or isinstance(part, str) for part in parts):
+            return parts
+        return None
+
+    def _cached_response(self, key: tuple[str | None, ...] | None) -> str | None:
+        """Return the cached response text for key, if any."""
+        return self._response_cache.get(key) if key is not None else None
+
+    def _store_response(self, key: tuple[str | None, ...] | None, text: str) -> str:
+        """Cache text under key unless the key is None. Returns text."""
+        if key is not None:
+            if len(self._response_cache) >= _RESPONSE_CACHE_SIZE:
+                del self._response_cache[next(iter(self._response_cache))]
+            self._response_cache[key] = text
+        return text
+
     async def _list_particles(self, args: dict[str, Any]) -> list[TextContent]:
         """List all particles with optional filtering."""
         import json
@@ -169,6 +198,11 @@ class MCPServer:
         category = args.get("category")
         status = args.get("status", "stable")
 
+        cache_key = self._response_key("list_particles", category, status)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return [TextContent(type="text", text=cached)]
+
         # Get list with filters applied
         primitives = self.registry.list(category=category, status=status)
 
@@ -187,7 +221,8 @@ class MCPServer:
             "count": len(particles),
             "particles": particles,
         }
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        text = self._store_response(cache_key, json.dumps(result, indent=2))
+        return [TextContent(type="text", text=text)]
 
     async def _get_primitive(self, args: dict[str, Any]) -> list[TextContent]:
         """Get full primitive definition."""
@@ -197,6 +232,11 @@ class MCPServer:
         if not primitive_id:
             return [TextContent(type="text", text='{"error": "primitive_id is required"}')]
 
+        cache_key = self._response_key("get_primitive", primitive_id)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return [TextContent(type="text", text=cached)]
+
         try:
             primitive = self.registry.get(primitive_id)
         except FileNotFoundError:
@@ -218,7 +258,8 @@ class MCPServer:
             },
             "examples": [ex.model_dump() for ex in primitive.examples] if primitive.examples else [],
         }
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        text = self._store_response(cache_key, json.dumps(result, indent=2))
+        return [TextContent(type="text", text=text)]
 
     async def _validate_plan(self, args: dict[str, Any]) -> list[TextContent]:
         """Validate a plan against all rules."""
@@ -341,16 +382,20 @@ class MCPServer:
             await self.server.run(read_stream, write_stream, self.server.create_initialization_options())
 
 
-def create_server(primitives_path: str = "primitives") -> MCPServer:
+def create_server(
+    primitives_path: str = "primitives",
+    registry: PrimitiveRegistry | None = None,
+) -> MCPServer:
     """Create and configure MCP server instance.
 
     Args:
         primitives_path: Path to primitives directory
+        registry: Existing registry to share (built from primitives_path if None)
 
     Returns:
         Configured MCPServer instance
     """
-    return MCPServer(primitives_path)
+    return MCPServer(primitives_path, registry=registry)
 
 
 async def main() -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,14 @@ import yaml
 
 from maicrosoft.core.models import Atom, Molecule, Particle, Primitive
 
+# libyaml-backed loader/dumper when PyYAML was built with it; shared by
+# every module that parses or writes YAML so the class is resolved once.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Short, heavily repeated registry entry fields shared via sys.intern
+INTERNED_FIELDS = ("id", "name", "category", "status")
+
 
 class PrimitiveLoader:
     """Loads primitive definitions from YAML files."""
@@ -43,13 +52,24 @@ class PrimitiveLoader:
 
     def load_yaml(self, path: Path) -> dict[str, Any]:
         """Load a YAML file."""
-        with open(path) as f:
-            return yaml.safe_load(f)
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=YAML_LOADER)
 
     def load_registry(self) -> dict[str, Any]:
         """Load the registry.yaml file."""
         registry_path = self.primitives_dir / "_meta" / "registry.yaml"
-        return self.load_yaml(registry_path)
+        registry = self.load_yaml(registry_path)
+
+        for entries in registry.values():
+            if not isinstance(entries, list):
+                continue
+            for entry in entries:
+                for field in INTERNED_FIELDS:
+                    value = entry.get(field)
+                    if isinstance(value, str):
+                        entry[field] = sys.intern(value)
+
+        return registry
 
     def load_primitive(self, primitive_id: str) -> Primitive:
         """Load a primitive by ID.
@@ -194,10 +194,13 @@ class PlanValidator:
         """Layer 4: Dependency validation."""
         violations = []
 
-        node_ids = {node.id for node in plan.nodes}
+        # Edge checks and the adjacency list for cycle detection share one pass
+        graph: dict[str, list[str]] = {node.id: [] for node in plan.nodes}
 
         for edge in plan.edges:
-            if edge.from_node not in node_ids:
+            if edge.from_node in graph:
+                graph[edge.from_node].append(edge.to_node)
+            else:
                 violations.append(
                     ValidationViolation(
                         level="error",
@@ -205,7 +208,7 @@ class PlanValidator:
                         message=f"Edge references non-existent node: {edge.from_node}",
                     )
                 )
-            if edge.to_node not in node_ids:
+            if edge.to_node not in graph:
                 violations.append(
                     ValidationViolation(
                         level="error",
@@ -214,7 +217,7 @@ class PlanValidator:
                     )
                 )
 
-        if self._has_cycle(plan):
+        if self._has_cycle(plan, graph):
             violations.append(
                 ValidationViolation(
                     level="error",
@@ -225,12 +228,18 @@ class PlanValidator:
 
         return violations
 
-    def _has_cycle(self, plan: Plan) -> bool:
-        """Check if plan has circular dependencies."""
-        graph: dict[str, list[str]] = {node.id: [] for node in plan.nodes}
-        for edge in plan.edges:
-            if edge.from_node in graph:
-                graph[edge.from_node].append(edge.to_node)
+    def _has_cycle(self, plan: Plan, graph: dict[str, list[str]] | None = None) -> bool:
+        """Check if plan has circular dependencies.
+
+        Args:
+            plan: The plan to check
+            graph: Prebuilt node id -> successor ids map (built from plan if None)
+        """
+        if graph is None:
+            graph = {node.id: [] for node in plan.nodes}
+            for edge in plan.edges:
+                if edge.from_node in graph:
+                    graph[edge.from_node].append(edge.to_node)
 
         visited: set[str] = set()
         rec_stack: set[str] = set()
@@ -0,0 +1,65 @@
+"""Tests for the GUI backend's bridge to the core library."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+BRIDGE_PATH = ROOT / "gui" / "backend" / "src" / "services" / "maicrosoft_bridge.py"
+
+
+@pytest.fixture(scope="module")
+def bridge():
+    """Load the bridge module from the generated backend."""
+    spec = importlib.util.spec_from_file_location("maicrosoft_bridge", BRIDGE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # The module-level singleton reads ./primitives
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(ROOT)
+        spec.loader.exec_module(module)
+    return module.MaicrosoftBridge(str(ROOT / "primitives"))
+
+
+def _plan(edges: list[dict]) -> dict:
+    """Two log nodes wired by the given edges."""
+    log_inputs = {"level": "info", "message": "hello"}
+    return {
+        "metadata": {"id": "bridge-plan", "name": "Bridge Plan", "version": "1.0.0"},
+        "nodes": [
+            {"id": "first", "primitive_id": "P010", "inputs": log_inputs},
+            {"id": "second", "primitive_id": "P010", "inputs": log_inputs},
+        ],
+        "edges": edges,
+    }
+
+
+class TestMaicrosoftBridge:
+    """Tests for MaicrosoftBridge.validate_plan."""
+
+    def test_validate_plan_accepts_valid_plan(self, bridge) -> None:
+        """Test that a well-formed plan validates."""
+        result = bridge.validate_plan(_plan([{"from_node": "first", "to_node": "second"}]))
+
+        assert result.valid
+
+    def test_validate_plan_rejects_cycles(self, bridge) -> None:
+        """Test that the dependency layer runs, not just the interface layer."""
+        result = bridge.validate_plan(
+            _plan(
+                [
+                    {"from_node": "first", "to_node": "second"},
+                    {"from_node": "second", "to_node": "first"},
+                ]
+            )
+        )
+
+        assert not result.valid
+        assert "CIRCULAR_DEPENDENCY" in [v.code for v in result.violations]
+
+    def test_validate_plan_rejects_dangling_edges(self, bridge) -> None:
+        """Test that edges to unknown nodes are reported."""
+        result = bridge.validate_plan(_plan([{"from_node": "first", "to_node": "missing"}]))
+
+        assert not result.valid
+        assert "INVALID_EDGE_TARGET" in [v.code for v in result.violations]
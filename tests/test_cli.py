@@ -0,0 +1,96 @@
+"""Tests for the CLI's on-disk plan cache."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from maicrosoft import cli
+
+PLAN_YAML = Path(__file__).parent.parent / "examples" / "simple_workflow" / "plan.yaml"
+
+
+@pytest.fixture
+def plan_cache(tmp_path, monkeypatch):
+    """Point the plan cache at a scratch directory and count plan parses."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(cli, "PLAN_CACHE_DIR", cache_dir)
+
+    parses = []
+    load_plan_data = cli.load_plan_data
+
+    def counting_load(plan_file):
+        parses.append(plan_file)
+        return load_plan_data(plan_file)
+
+    monkeypatch.setattr(cli, "load_plan_data", counting_load)
+    return cache_dir, parses
+
+
+@pytest.fixture
+def plan_file(tmp_path):
+    """A copy of the example plan that tests may edit."""
+    path = tmp_path / "plan.yaml"
+    path.write_bytes(PLAN_YAML.read_bytes())
+    return path
+
+
+class TestLoadAndValidate:
+    """Tests for load_and_validate."""
+
+    def test_second_load_is_served_from_cache(self, plan_cache, plan_file):
+        """Test that an unchanged plan is parsed once."""
+        _, parses = plan_cache
+
+        first_plan, first_result = cli.load_and_validate(plan_file)
+        second_plan, second_result = cli.load_and_validate(plan_file)
+
+        assert len(parses) == 1
+        assert second_plan == first_plan
+        assert second_result.valid == first_result.valid
+
+    def test_edited_plan_is_parsed_again(self, plan_cache, plan_file):
+        """Test that editing the plan file invalidates its entry."""
+        _, parses = plan_cache
+        cli.load_and_validate(plan_file)
+
+        data = yaml.safe_load(plan_file.read_text())
+        data["metadata"]["name"] = "Renamed Plan"
+        plan_file.write_text(yaml.safe_dump(data))
+        plan, _ = cli.load_and_validate(plan_file)
+
+        assert len(parses) == 2
+        assert plan.metadata.name == "Renamed Plan"
+
+    def test_validator_source_is_part_of_the_key(self, plan_cache, plan_file, monkeypatch):
+        """Test that a change to the validation code misses the cache."""
+        _, parses = plan_cache
+        cli.load_and_validate(plan_file)
+
+        monkeypatch.setattr(cli, "_validation_source_digest", lambda: b"edited source")
+        cli.load_and_validate(plan_file)
+
+        assert len(parses) == 2
+
+    def test_cache_is_pruned(self, plan_cache, tmp_path, monkeypatch):
+        """Test that old entries are deleted past PLAN_CACHE_MAX_ENTRIES."""
+        cache_dir, _ = plan_cache
+        monkeypatch.setattr(cli, "PLAN_CACHE_MAX_ENTRIES", 2)
+
+        for i in range(4):
+            path = tmp_path / f"plan{i}.yaml"
+            path.write_bytes(PLAN_YAML.read_bytes())
+            cli.load_and_validate(path)
+
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_malformed_plan_raises_parse_error(self, plan_cache, tmp_path):
+        """Test that invalid YAML and non-plan documents raise the parse errors."""
+        bad_yaml = tmp_path / "bad.yaml"
+        bad_yaml.write_text("metadata: [unclosed\n")
+        not_a_plan = tmp_path / "empty.yaml"
+        not_a_plan.write_text("")
+
+        for path in (bad_yaml, not_a_plan):
+            with pytest.raises(cli._plan_errors()):
+                cli.load_and_validate(path)
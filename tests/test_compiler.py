@@ -1,7 +1,9 @@
-"""Tests for the N8N compiler."""
+"""Tests for the N8N and meta-plan compilers."""
 
 import pytest
 import json
+import shutil
+from pathlib import Path
 
 from maicrosoft.core.models import (
     Plan,
@@ -245,3 +247,147 @@ class TestN8NCompiler:
         json_str = json.dumps(result)
         assert json_str
         assert isinstance(json.loads(json_str), dict)
+
+    def test_to_json_keeps_large_integers_and_int_keys(self, compiler, simple_plan):
+        """Test that to_json serializes values orjson rejects, like json does."""
+        simple_plan.nodes[0].inputs["timeout"] = 2**70
+        simple_plan.nodes[0].inputs["headers"] = {1: "a"}
+
+        result = json.loads(compiler.to_json(simple_plan))
+
+        parameters = result["nodes"][1]["parameters"]
+        assert parameters["timeout"] == 2**70
+        assert parameters["headerParameters"] == {"1": "a"}
+
+    def test_compile_assigns_unique_uuid4_ids(self, compiler, simple_plan):
+        """Test that nodes and the workflow version get distinct v4 UUIDs."""
+        import uuid
+
+        result = compiler.compile(simple_plan)
+
+        ids = [n["id"] for n in result["nodes"]] + [result["versionId"]]
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(i).version == 4 for i in ids)
+
+    def test_compile_trigger_parameters_are_not_shared(self, compiler, simple_plan):
+        """Test that each compile gets its own trigger parameter dicts."""
+        simple_plan.trigger = Trigger(type="schedule")
+
+        first = compiler.compile(simple_plan)["nodes"][0]["parameters"]
+        first["rule"]["interval"][0]["hoursInterval"] = 6
+        second = compiler.compile(simple_plan)["nodes"][0]["parameters"]
+
+        assert second["rule"] == {"interval": [{"field": "hours", "hoursInterval": 1}]}
+
+
+@pytest.fixture
+def meta_plan_path(tmp_path):
+    """Copy the simple GUI meta-plan into a scratch directory."""
+    source = Path(__file__).parents[1] / "gui" / "meta-plan-simple.yaml"
+    path = tmp_path / "meta-plan.yaml"
+    shutil.copyfile(source, path)
+    return path
+
+
+class TestMetaPlanCompiler:
+    """Tests for the meta-plan compiler."""
+
+    def test_stale_sidecar_is_ignored(self, meta_plan_path):
+        """Test that a parse cached by another compiler build is parsed and validated again."""
+        pytest.importorskip("orjson")
+        from maicrosoft.compiler.metaplan import _parse_sections, _sidecar_path, load_meta_plan
+
+        with open(meta_plan_path, "rb") as f:
+            stale = _parse_sections(f)
+        del stale["api"]["auth"]["routes"][0]["method"]
+        # Sidecar layout written before the compiler digest was recorded
+        Path(_sidecar_path(str(meta_plan_path))).write_text(
+            json.dumps({"mtime_ns": meta_plan_path.stat().st_mtime_ns, "plan": stale})
+        )
+
+        plan = load_meta_plan(str(meta_plan_path))
+
+        assert plan["api"]["auth"]["routes"][0]["method"] == "POST"
+
+    def test_unchanged_recompile_is_a_no_op(self, meta_plan_path, monkeypatch):
+        """Test that a second compile touches no files and skips the generators."""
+        from maicrosoft.compiler import MetaPlanCompiler
+
+        generated = MetaPlanCompiler(str(meta_plan_path)).compile()
+        paths = [Path(p) for files in generated.values() for p in files]
+        mtimes = [p.stat().st_mtime_ns for p in paths]
+
+        def fail(self):
+            raise AssertionError("generators ran")
+
+        monkeypatch.setattr(MetaPlanCompiler, "_render", fail)
+        assert MetaPlanCompiler(str(meta_plan_path)).compile() == generated
+        assert [p.stat().st_mtime_ns for p in paths] == mtimes
+
+    def test_deleted_output_is_regenerated(self, meta_plan_path, monkeypatch):
+        """Test that a missing output is rewritten from the in-process render cache."""
+        from maicrosoft.compiler import MetaPlanCompiler
+
+        generated = MetaPlanCompiler(str(meta_plan_path)).compile()
+        deleted = Path(generated["backend"][0])
+        content = deleted.read_bytes()
+        deleted.unlink()
+
+        def fail(self):
+            raise AssertionError("generators ran")
+
+        monkeypatch.setattr(MetaPlanCompiler, "_render", fail)
+        assert MetaPlanCompiler(str(meta_plan_path)).compile() == generated
+        assert deleted.read_bytes() == content
+
+    def test_invalid_meta_plan_raises_value_error(self, meta_plan_path):
+        """Test that a meta-plan failing the schema is rejected before generating."""
+        from maicrosoft.compiler import MetaPlanCompiler
+
+        text = meta_plan_path.read_text()
+        meta_plan_path.write_text(text.replace("        method: POST\n", "", 1))
+
+        with pytest.raises(ValueError, match="Invalid meta-plan"):
+            MetaPlanCompiler(str(meta_plan_path))
+
+    def test_generated_models_fit_line_length(self, meta_plan_path):
+        """Test that long Enum columns and Index calls are wrapped to _LINE_LENGTH."""
+        from maicrosoft.compiler import MetaPlanCompiler
+        from maicrosoft.compiler.metaplan import _LINE_LENGTH
+
+        generated = MetaPlanCompiler(str(meta_plan_path)).compile()
+        models = [Path(p) for p in generated["backend"] if "/models/" in p]
+
+        assert models
+        for path in models:
+            for line in path.read_text().splitlines():
+                assert len(line) <= _LINE_LENGTH, f"{path.name}: {line}"
+
+    def test_edited_output_is_restored(self, meta_plan_path):
+        """Test that a generated file changed on disk is rewritten on the next compile."""
+        from maicrosoft.compiler import MetaPlanCompiler
+
+        generated = MetaPlanCompiler(str(meta_plan_path)).compile()
+        edited = Path(generated["backend"][0])
+        content = edited.read_bytes()
+        edited.write_bytes(content[: len(content) // 2])
+
+        MetaPlanCompiler(str(meta_plan_path)).compile()
+
+        assert edited.read_bytes() == content
+
+    def test_lock_paths_follow_the_caller_cwd(self, meta_plan_path, monkeypatch):
+        """Test that outputs recorded from one directory resolve from another."""
+        from maicrosoft.compiler import MetaPlanCompiler
+
+        monkeypatch.chdir(meta_plan_path.parent)
+        MetaPlanCompiler(meta_plan_path.name).compile()
+
+        def fail(self):
+            raise AssertionError("outputs rewritten")
+
+        monkeypatch.setattr(MetaPlanCompiler, "_flush", fail)
+        monkeypatch.chdir(meta_plan_path.parent.parent)
+        cached = MetaPlanCompiler(f"{meta_plan_path.parent.name}/{meta_plan_path.name}").compile()
+
+        assert all(Path(p).is_file() for files in cached.values() for p in files)
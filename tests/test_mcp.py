@@ -39,6 +39,27 @@ class TestMCPServer:
         for p in data["particles"]:
             assert p["category"] == "io"
 
+    @pytest.mark.asyncio
+    async def test_list_particles_with_non_string_filter(self, mcp_server):
+        """Test that a non-string category matches nothing and is not cached."""
+        result = await mcp_server._list_particles({"category": ["io"]})
+
+        assert json.loads(result[0].text)["count"] == 0
+        assert mcp_server._response_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_response_cache_is_bounded(self, mcp_server, monkeypatch):
+        """Test that the oldest responses are dropped past the cache size."""
+        monkeypatch.setattr("maicrosoft.mcp.server._RESPONSE_CACHE_SIZE", 2)
+
+        for category in ("a", "b", "c"):
+            await mcp_server._list_particles({"category": category})
+
+        assert list(mcp_server._response_cache) == [
+            ("list_particles", "b", "stable"),
+            ("list_particles", "c", "stable"),
+        ]
+
     @pytest.mark.asyncio
     async def test_get_primitive(self, mcp_server):
         """Test getting a specific primitive."""